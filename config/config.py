@@ -2,44 +2,77 @@
 Configuration file for Intraday Stock Screener
 """
 
-# Trading Parameters
-TRADING_CONFIG = {
+from dataclasses import asdict, dataclass, fields
+from typing import Mapping, Optional, Union
+
+
+@dataclass(frozen=True)
+class TradingConfig:
+    """Trading parameters (immutable; read via attribute access)"""
+
     # Pre-Market Screening Time
-    'pre_market_start': '08:45',
-    'pre_market_end': '09:15',
+    pre_market_start: str = '08:45'
+    pre_market_end: str = '09:15'
 
     # Live Market Screening Time
-    'live_market_start': '09:20',
+    live_market_start: str = '09:20'
 
     # Market Close
-    'market_close': '15:30',
+    market_close: str = '15:30'
 
     # Gap Filter
-    'gap_min_pct': 0.3,
-    'gap_max_pct': 2.0,
+    gap_min_pct: float = 0.3
+    gap_max_pct: float = 2.0
 
     # Volume Filter
-    'volume_lookback_days': 20,
-    'min_volume_multiplier': 1.2,  # Pre-open volume should be 1.2x average
+    volume_lookback_days: int = 20
+    min_volume_multiplier: float = 1.2  # Pre-open volume should be 1.2x average
 
     # Range Filter
-    'min_range_pct': 0.8,  # Minimum daily range as % of price
+    min_range_pct: float = 0.8  # Minimum daily range as % of price
 
     # Candidate Limits
-    'pre_market_candidates': 8,
-    'live_market_candidates': 4,
+    pre_market_candidates: int = 8
+    live_market_candidates: int = 4
 
     # Technical Indicators
-    'ema_fast': 20,
-    'ema_slow': 200,
+    ema_fast: int = 20
+    ema_slow: int = 200
+    rsi_period: int = 14
 
     # Risk Management
-    'risk_per_trade_pct': 1.0,  # 1% of capital per trade
-    'max_trades_per_day': 3,
-    'max_consecutive_losses': 2,
-    'atr_period': 14,
-    'stop_loss_atr_multiplier': 1.5,
-}
+    risk_per_trade_pct: float = 1.0  # 1% of capital per trade
+    max_trades_per_day: int = 3
+    max_consecutive_losses: int = 2
+    atr_period: int = 14
+    stop_loss_atr_multiplier: float = 1.5
+
+    @classmethod
+    def from_config(cls, config: Optional[Union["TradingConfig", Mapping]] = None) -> "TradingConfig":
+        """
+        Resolve the config argument accepted by the trading components
+
+        Args:
+            config: TradingConfig, a mapping such as TRADING_CONFIG (missing
+                keys take the defaults, unknown keys are ignored), or None
+
+        Returns:
+            TradingConfig instance (the shared CONFIG when config is None)
+        """
+        if config is None:
+            return CONFIG
+        if isinstance(config, cls):
+            return config
+
+        names = {field.name for field in fields(cls)}
+        return cls(**{key: value for key, value in config.items() if key in names})
+
+
+# Trading Parameters
+CONFIG = TradingConfig()
+
+# Dict view of CONFIG for code that still expects a mapping
+TRADING_CONFIG = asdict(CONFIG)
 
 # Nifty 50 Stock List (as of 2025)
 NIFTY_50_STOCKS = [
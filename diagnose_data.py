@@ -5,16 +5,25 @@ Run this to diagnose issues with fetching live NSE data
 """
 
 import sys
-from datetime import datetime
+from datetime import datetime, time as dtime
 import pytz
 
 # Import the enhanced data fetcher
-from src.enhanced_data_fetcher import EnhancedDataFetcher, test_data_fetching
+from src.enhanced_data_fetcher import BufferedOutputExecutor, EnhancedDataFetcher, test_data_fetching
+
+# Exchange timezone and session boundaries (IST)
+IST = pytz.timezone('Asia/Kolkata')
+PRE_OPEN = dtime(9, 0)
+OPEN = dtime(9, 15)
+CLOSE = dtime(15, 30)
+
+INTERVALS = ['1m', '5m', '15m', '30m', '1h']
+
 
 def check_market_status():
     """Check if market is currently open"""
-    ist = pytz.timezone('Asia/Kolkata')
-    now = datetime.now(ist)
+    now = datetime.now(IST)
+    t = now.time()
 
     print("\n" + "="*60)
     print("MARKET STATUS CHECK")
@@ -28,25 +37,21 @@ def check_market_status():
         return False
 
     # Check market hours
-    market_open = now.replace(hour=9, minute=15, second=0, microsecond=0)
-    market_close = now.replace(hour=15, minute=30, second=0, microsecond=0)
-    pre_market_start = now.replace(hour=9, minute=0, second=0, microsecond=0)
-
-    if now < pre_market_start:
+    if t < PRE_OPEN:
         print(f"\n⚠️  Market is CLOSED (Before pre-market)")
-        print(f"Market opens at: {market_open.strftime('%H:%M:%S')}")
+        print(f"Market opens at: {OPEN}")
         return False
-    elif pre_market_start <= now < market_open:
+    elif PRE_OPEN <= t < OPEN:
         print(f"\n⏰ Pre-market Session")
-        print(f"Market opens at: {market_open.strftime('%H:%M:%S')}")
+        print(f"Market opens at: {OPEN}")
         return False
-    elif market_open <= now <= market_close:
+    elif OPEN <= t <= CLOSE:
         print(f"\n✓ Market is OPEN")
-        print(f"Market closes at: {market_close.strftime('%H:%M:%S')}")
+        print(f"Market closes at: {CLOSE}")
         return True
     else:
         print(f"\n⚠️  Market is CLOSED (After hours)")
-        print(f"Market opens tomorrow at: {market_open.strftime('%H:%M:%S')}")
+        print(f"Market opens tomorrow at: {OPEN}")
         return False
 
 
@@ -79,9 +84,17 @@ def detailed_test(symbol: str):
     # Try fetching with different intervals
     print("\nTrying to fetch data with different intervals...")
 
-    for interval in ['1m', '5m', '15m', '30m', '1h']:
+    # Fetch all intervals concurrently (network-bound), live and verbose;
+    # each fetch's trace is buffered and printed in INTERVALS order
+    with BufferedOutputExecutor(max_workers=len(INTERVALS)) as executor:
+        fetches = list(executor.map(
+            lambda interval: fetcher.get_intraday_data_robust(symbol, interval=interval, verbose=True, use_cache=False),
+            INTERVALS
+        ))
+
+    for interval, (data, trace) in zip(INTERVALS, fetches):
         print(f"\n  Testing {interval} interval:")
-        data = fetcher.get_intraday_data_robust(symbol, interval=interval, verbose=True)
+        print(trace, end='')
         if not data.empty:
             print(f"    ✓ Got {len(data)} candles")
             print(f"    Time range: {data.index[0]} to {data.index[-1]}")
@@ -12,8 +12,7 @@ from src.pre_market_screener import PreMarketScreener
 from src.live_market_filter import LiveMarketFilter
 from src.trading_strategy import TradingStrategy
 from src.risk_manager import RiskManager
-from src.ml_predictor import MLPredictor
-from config.config import TRADING_CONFIG, NIFTY_50_STOCKS
+from config.config import NIFTY_50_STOCKS
 
 
 def print_header():
@@ -26,59 +25,71 @@ def print_header():
 
 
 def print_trading_plan(plans: list, risk_manager: RiskManager, capital: float):
-    """Print detailed trading plans"""
+    """
+    Print detailed trading plans
+
+    Each plan's risk validation is stored under plan['validation'] so
+    callers can reuse it without re-validating.
+    """
     if not plans:
         print("\n⚠️  No trading setups found!")
         return
 
-    print("\n" + "="*60)
-    print("📋 DETAILED TRADING PLANS")
-    print("="*60)
+    buf = []
+    w = buf.append
+
+    w("\n" + "="*60)
+    w("📋 DETAILED TRADING PLANS")
+    w("="*60)
 
     for i, plan in enumerate(plans, 1):
-        print(f"\n{i}. {plan['symbol']} - {plan['setup_type']} SETUP")
-        print("-" * 60)
-
-        print(f"\n   Setup Quality: {plan['setup_quality']:.0f}/100")
-        print(f"   Reversal Pattern: {plan['reversal_pattern']}")
-
-        print(f"\n   Entry Details:")
-        print(f"      Entry Price: ₹{plan['entry_price']:.2f}")
-        print(f"      Stop Loss: ₹{plan['stop_loss']:.2f}")
-        print(f"      Target: ₹{plan['target']:.2f}")
-        print(f"      Risk:Reward = 1:{plan['risk_reward_ratio']:.1f}")
-
-        print(f"\n   Technical Levels:")
-        print(f"      20 EMA: ₹{plan['technical_levels']['ema_20']:.2f}")
-        print(f"      200 EMA: ₹{plan['technical_levels']['ema_200']:.2f}")
-        print(f"      VWAP: ₹{plan['technical_levels']['vwap']:.2f}")
-
-        print(f"\n   Market Data:")
-        print(f"      ATR: ₹{plan['atr']:.2f}")
-        print(f"      Volume Surge: {plan['volume_surge']:.2f}x")
+        w(f"\n{i}. {plan['symbol']} - {plan['setup_type']} SETUP")
+        w("-" * 60)
+
+        w(f"\n   Setup Quality: {plan['setup_quality']:.0f}/100")
+        w(f"   Reversal Pattern: {plan['reversal_pattern']}")
+
+        w(f"\n   Entry Details:")
+        w(f"      Entry Price: ₹{plan['entry_price']:.2f}")
+        w(f"      Stop Loss: ₹{plan['stop_loss']:.2f}")
+        w(f"      Target: ₹{plan['target']:.2f}")
+        w(f"      Risk:Reward = 1:{plan['risk_reward_ratio']:.1f}")
+
+        w(f"\n   Technical Levels:")
+        w(f"      20 EMA: ₹{plan['technical_levels']['ema_20']:.2f}")
+        w(f"      200 EMA: ₹{plan['technical_levels']['ema_200']:.2f}")
+        w(f"      VWAP: ₹{plan['technical_levels']['vwap']:.2f}")
+
+        w(f"\n   Market Data:")
+        w(f"      ATR: ₹{plan['atr']:.2f}")
+        w(f"      Volume Surge: {plan['volume_surge']:.2f}x")
         if 'gap_pct' in plan:
-            print(f"      Gap: {plan['gap_pct']:+.2f}%")
+            w(f"      Gap: {plan['gap_pct']:+.2f}%")
 
         # Calculate position sizing
         validation = risk_manager.validate_trade_plan(plan, capital)
+        plan['validation'] = validation
 
         if validation['valid']:
-            print(f"\n   Position Sizing (Capital: ₹{capital:,.0f}):")
-            print(f"      Quantity: {validation['quantity']} shares")
-            print(f"      Position Value: ₹{validation['position_value']:,.2f}")
-            print(f"      Risk Amount: ₹{validation['risk_amount']:,.2f} ({validation['risk_pct']:.1f}%)")
-            print(f"      Potential Profit: ₹{validation['potential_profit']:,.2f}")
+            w(f"\n   Position Sizing (Capital: ₹{capital:,.0f}):")
+            w(f"      Quantity: {validation['quantity']} shares")
+            w(f"      Position Value: ₹{validation['position_value']:,.2f}")
+            w(f"      Risk Amount: ₹{validation['risk_amount']:,.2f} ({validation['risk_pct']:.1f}%)")
+            w(f"      Potential Profit: ₹{validation['potential_profit']:,.2f}")
 
-            print(f"\n   ✅ TRADE APPROVED")
+            w(f"\n   ✅ TRADE APPROVED")
         else:
-            print(f"\n   ❌ TRADE REJECTED: {validation['reason']}")
+            w(f"\n   ❌ TRADE REJECTED: {validation['reason']}")
 
         if 'ml_prediction' in plan and plan['ml_prediction']:
-            print(f"\n   ML Prediction:")
-            print(f"      Direction: {plan['ml_prediction'].upper()}")
-            print(f"      Probability: {plan['ml_probability']:.1%}")
-            print(f"      Confidence: {plan['ml_confidence']:.1%}")
-            print(f"      ML Score: {plan.get('ml_score', 0):.0f}/100")
+            w(f"\n   ML Prediction:")
+            w(f"      Direction: {plan['ml_prediction'].upper()}")
+            w(f"      Probability: {plan['ml_probability']:.1%}")
+            w(f"      Confidence: {plan['ml_confidence']:.1%}")
+            w(f"      ML Score: {plan.get('ml_score', 0):.0f}/100")
+
+    sys.stdout.write('\n'.join(buf) + '\n')
+    sys.stdout.flush()
 
 
 def run_pre_market_screening():
@@ -113,6 +124,8 @@ def run_strategy_analysis(candidates: list, use_ml: bool = False):
 
     # Apply ML ranking if enabled
     if use_ml and trading_plans:
+        from src.ml_predictor import MLPredictor
+
         ml_predictor = MLPredictor()
         trading_plans = ml_predictor.rank_candidates(trading_plans)
 
@@ -182,6 +195,8 @@ Examples:
         if args.mode == 'train-ml':
             # Train ML model
             print("🤖 Training ML Model on Nifty 50 stocks...\n")
+            from src.ml_predictor import MLPredictor
+
             ml_predictor = MLPredictor()
             ml_predictor.train_model(NIFTY_50_STOCKS, period='6mo')
 
@@ -256,18 +271,14 @@ Examples:
             print("🎯 FINAL RECOMMENDATIONS")
             print("="*60)
 
-            approved_plans = []
-            for plan in trading_plans:
-                validation = risk_manager.validate_trade_plan(plan, args.capital)
-                if validation['valid']:
-                    approved_plans.append(plan)
+            approved_plans = [plan for plan in trading_plans if plan['validation']['valid']]
 
             if approved_plans:
                 print(f"\n✓ {len(approved_plans)} trade(s) approved for execution:")
                 for i, plan in enumerate(approved_plans, 1):
                     print(f"\n{i}. {plan['symbol']} - {plan['setup_type']}")
                     print(f"   Entry: ₹{plan['entry_price']:.2f} | SL: ₹{plan['stop_loss']:.2f} | Target: ₹{plan['target']:.2f}")
-                    validation = risk_manager.validate_trade_plan(plan, args.capital)
+                    validation = plan['validation']
                     print(f"   Quantity: {validation['quantity']} shares | Risk: ₹{validation['risk_amount']:,.2f}")
 
                 print("\n📝 Remember:")
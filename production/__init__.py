@@ -6,23 +6,35 @@ A modular, configurable screening and signal generation system for Nifty 50 stoc
 __version__ = "1.0.0"
 __author__ = "Stock Screener Team"
 
-from .data_ingest import CSVDataLoader, DataValidator
-from .indicators import EMA, VWAP, ATR
-from .screener import PreMarketScreener, LiveMarketFilter
-from .signal_engine import SignalGenerator
-from .risk_manager import RiskManager, PositionSizer
-from .backtester import BacktestEngine
-
-__all__ = [
-    "CSVDataLoader",
-    "DataValidator",
-    "EMA",
-    "VWAP",
-    "ATR",
-    "PreMarketScreener",
-    "LiveMarketFilter",
-    "SignalGenerator",
-    "RiskManager",
-    "PositionSizer",
-    "BacktestEngine",
-]
+import importlib
+
+# Public name -> submodule; imported on first attribute access (PEP 562)
+# so that importing the package does not pull in pandas/numpy up front
+_LAZY_IMPORTS = {
+    "CSVDataLoader": ".data_ingest",
+    "DataValidator": ".data_ingest",
+    "EMA": ".indicators",
+    "VWAP": ".indicators",
+    "ATR": ".indicators",
+    "PreMarketScreener": ".screener",
+    "LiveMarketFilter": ".screener",
+    "SignalGenerator": ".signal_engine",
+    "RiskManager": ".risk_manager",
+    "PositionSizer": ".risk_manager",
+    "BacktestEngine": ".backtester",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
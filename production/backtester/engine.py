@@ -5,8 +5,9 @@ Simulates the screening and trading strategy on historical data
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List
-from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
 import logging
 
 from ..screener import PreMarketScreener, LiveMarketFilter
@@ -15,6 +16,110 @@ from ..risk_manager import RiskManager, PositionSizer
 
 logger = logging.getLogger(__name__)
 
+# One row per trading day in the backtest
+DAILY_DT = np.dtype([
+    ('date', 'datetime64[D]'),
+    ('pre_market_candidates', np.int32),
+    ('live_market_candidates', np.int32),
+    ('signals', np.int32),
+    ('trades', np.int32),
+    ('pnl', np.float64),
+])
+
+
+def _drawdown_stats(daily_pnl: np.ndarray):
+    """
+    Compute max drawdown, mean and std of a daily P&L series
+
+    Reuses one scratch buffer for the cumulative/peak/drawdown passes
+    instead of allocating a new array per step.
+
+    Args:
+        daily_pnl: Daily P&L as a float64 array (may be a strided view)
+
+    Returns:
+        Tuple of (max_drawdown, mean, std)
+    """
+    if len(daily_pnl) == 0:
+        return 0.0, 0.0, 0.0
+
+    cumulative = np.cumsum(daily_pnl)
+    buf = np.maximum.accumulate(cumulative)
+    np.subtract(buf, cumulative, out=buf)
+    max_drawdown = buf.max()
+
+    # The cumulative sum already holds the total; no separate mean pass
+    mean = cumulative[-1] / len(daily_pnl)
+    np.subtract(daily_pnl, mean, out=buf)
+    std = np.sqrt(np.dot(buf, buf) / len(buf))
+
+    return max_drawdown, mean, std
+
+
+def _day_record(
+    date: datetime,
+    day_run: Dict,
+    signals: int = 0,
+    trades: int = 0,
+    pnl: float = 0.0
+) -> tuple:
+    """
+    Build one DAILY_DT row for a trading day
+
+    Args:
+        date: Trading date
+        day_run: Screening counts from _run_one_day
+        signals: Number of signals generated
+        trades: Number of trades taken
+        pnl: Day P&L
+
+    Returns:
+        Tuple matching DAILY_DT field order
+    """
+    return (
+        np.datetime64(date, 'D'),
+        day_run['pre_market_candidates'],
+        day_run['live_market_candidates'],
+        signals,
+        trades,
+        pnl
+    )
+
+
+def _daily_records(daily_results: np.ndarray) -> List[Dict]:
+    """
+    Convert the daily results array to a list of dicts for reporting
+
+    Args:
+        daily_results: Structured array of daily results (DAILY_DT)
+
+    Returns:
+        List of daily result dictionaries
+    """
+    dates = daily_results['date'].astype('datetime64[us]').tolist()
+    columns = [name for name in DAILY_DT.names if name != 'date']
+
+    return [
+        {'date': date, **dict(zip(columns, row))}
+        for date, row in zip(dates, daily_results[columns].tolist())
+    ]
+
+
+# Per-process engine used by the worker pool (built once by _init_worker
+# so each worker keeps its own data cache across its days)
+_worker_engine = None
+
+
+def _init_worker(config: Dict):
+    """Build the backtest engine for a worker process"""
+    global _worker_engine
+    _worker_engine = BacktestEngine(config)
+
+
+def _run_days_in_worker(days: List[datetime]) -> List[Optional[Dict]]:
+    """Run a contiguous block of backtest days in a worker process"""
+    return [_worker_engine._run_one_day(day) for day in days]
+
 
 class BacktestEngine:
     """
@@ -29,10 +134,25 @@ class BacktestEngine:
             config: Configuration dictionary
         """
         self.config = config
-        self.pre_market_screener = PreMarketScreener(config)
-        self.live_market_filter = LiveMarketFilter(config)
+
+        # Full daily history per symbol, loaded once per engine (holds
+        # the whole universe; no eviction)
+        self._daily_history: Dict[str, pd.DataFrame] = {}
+
+        self.pre_market_screener = PreMarketScreener(
+            config,
+            daily_data_provider=self._load_symbol
+        )
+        self.live_market_filter = LiveMarketFilter(
+            config,
+            data_loader=self.pre_market_screener.data_loader
+        )
         self.signal_generator = SignalGenerator(config)
 
+        # PCG64 generator for exit simulation (seed from config for reproducible runs).
+        # The bit generator is pinned so seeded results don't depend on NumPy's default.
+        self._rng = np.random.Generator(np.random.PCG64(config.get('backtest', {}).get('seed')))
+
     def run_backtest(
         self,
         start_date: datetime,
@@ -42,6 +162,14 @@ class BacktestEngine:
         """
         Run backtest over date range
 
+        Screening, filtering and signal generation are independent across
+        days; with backtest.max_workers > 1 they run in a process pool, each
+        worker taking one contiguous block of days. Every worker loads the
+        universe's data itself, so memory grows with the worker count.
+        Trade execution depends on risk
+        manager state carried over from earlier days (capital, consecutive
+        losses) and is replayed sequentially in date order.
+
         Args:
             start_date: Start date
             end_date: End date
@@ -50,175 +178,249 @@ class BacktestEngine:
         Returns:
             Dictionary with backtest results
         """
-        logger.info(f"Running backtest from {start_date.date()} to {end_date.date()}")
+        logger.info("Running backtest from %s to %s", start_date.date(), end_date.date())
 
         # Initialize risk manager
         risk_manager = RiskManager(initial_capital, self.config)
 
-        # Track daily results
-        daily_results = []
+        # Trading days (weekdays minus configured exchange holidays)
+        holidays = self.config.get('market', {}).get('holidays') or []
+        trading_days = list(
+            pd.bdate_range(start_date, end_date, freq='C', holidays=holidays).to_pydatetime()
+        )
+
+        # Steps 1-3 for every day; serial unless worker processes are configured
+        max_workers = min(self.config.get('backtest', {}).get('max_workers') or 1, len(trading_days))
+
+        if max_workers > 1:
+            # One contiguous block of days per worker: a single task each,
+            # instead of interleaving small day chunks across all workers
+            blocks = [block.tolist() for block in np.array_split(np.array(trading_days, dtype=object), max_workers)]
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(self.config,)
+            ) as executor:
+                day_runs = [run for block_runs in executor.map(_run_days_in_worker, blocks) for run in block_runs]
+        else:
+            day_runs = [self._run_one_day(day) for day in trading_days]
 
-        # Iterate through trading days
-        current_date = start_date
+        # Track daily results (days that fail are left out)
+        daily_results = np.zeros(len(trading_days), dtype=DAILY_DT)
+        n_days = 0
 
-        while current_date <= end_date:
-            # Skip weekends
-            if current_date.weekday() >= 5:
-                current_date += timedelta(days=1)
+        for current_date, day_run in zip(trading_days, day_runs):
+            if day_run is None:
+                # Screening failed for this day (already logged)
                 continue
 
-            logger.info(f"\n{'='*60}")
-            logger.info(f"Backtesting: {current_date.date()}")
-            logger.info(f"{'='*60}")
-
             # Reset daily counters
             risk_manager.reset_daily_counters()
 
-            try:
-                # Step 1: Pre-market screening
-                pre_market_candidates = self.pre_market_screener.run_screening(current_date)
-
-                if not pre_market_candidates:
-                    logger.info("No pre-market candidates")
-                    daily_results.append({
-                        'date': current_date,
-                        'pre_market_candidates': 0,
-                        'live_market_candidates': 0,
-                        'signals': 0,
-                        'trades': 0,
-                        'pnl': 0
-                    })
-                    current_date += timedelta(days=1)
-                    continue
-
-                # Step 2: Live market filtering
-                live_market_candidates = self.live_market_filter.run_filtering(
-                    pre_market_candidates,
-                    current_date
-                )
+            signals = day_run['signals']
 
-                if not live_market_candidates:
-                    logger.info("No live market candidates")
-                    daily_results.append({
-                        'date': current_date,
-                        'pre_market_candidates': len(pre_market_candidates),
-                        'live_market_candidates': 0,
-                        'signals': 0,
-                        'trades': 0,
-                        'pnl': 0
-                    })
-                    current_date += timedelta(days=1)
-                    continue
-
-                # Step 3: Generate signals
-                signals = self.signal_generator.generate_signals(live_market_candidates)
-
-                if not signals:
-                    logger.info("No signals generated")
-                    daily_results.append({
-                        'date': current_date,
-                        'pre_market_candidates': len(pre_market_candidates),
-                        'live_market_candidates': len(live_market_candidates),
-                        'signals': 0,
-                        'trades': 0,
-                        'pnl': 0
-                    })
-                    current_date += timedelta(days=1)
-                    continue
+            if not signals:
+                daily_results[n_days] = _day_record(current_date, day_run)
+                n_days += 1
+                continue
 
+            try:
                 # Step 4: Execute trades
-                day_pnl = 0
-                trades_taken = 0
-
-                for signal in signals:
-                    # Check if can take trade
-                    can_trade, reason = risk_manager.can_take_trade()
-
-                    if not can_trade:
-                        logger.info(f"Cannot take trade: {reason}")
-                        break
-
-                    # Validate signal and calculate position
-                    is_valid, reason, position = PositionSizer.validate_signal(
-                        signal,
-                        risk_manager.capital,
-                        self.config
-                    )
-
-                    if not is_valid:
-                        logger.warning(f"Invalid signal for {signal['symbol']}: {reason}")
-                        continue
-
-                    # Add trade
-                    trade = risk_manager.add_trade(
-                        signal['symbol'],
-                        signal,
-                        position,
-                        current_date
-                    )
-
-                    # Simulate trade exit (simplified: assume hit target or stop)
-                    exit_price = self._simulate_exit(signal, current_date)
-
-                    # Close trade
-                    closed_trade = risk_manager.close_trade(
-                        trade['id'],
-                        exit_price,
-                        current_date
-                    )
-
-                    day_pnl += closed_trade['pnl']
-                    trades_taken += 1
+                day_pnl, trades_taken = self._execute_day(
+                    risk_manager,
+                    signals,
+                    self._simulate_exits(signals),
+                    current_date
+                )
 
                 # Record daily results
-                daily_results.append({
-                    'date': current_date,
-                    'pre_market_candidates': len(pre_market_candidates),
-                    'live_market_candidates': len(live_market_candidates),
-                    'signals': len(signals),
-                    'trades': trades_taken,
-                    'pnl': day_pnl
-                })
+                daily_results[n_days] = _day_record(
+                    current_date,
+                    day_run,
+                    signals=len(signals),
+                    trades=trades_taken,
+                    pnl=day_pnl
+                )
+                n_days += 1
 
             except Exception as e:
-                logger.error(f"Error on {current_date.date()}: {e}")
-
-            # Move to next day
-            current_date += timedelta(days=1)
+                logger.error("Error on %s: %s", current_date.date(), e)
 
         # Calculate overall metrics
-        results = self._calculate_metrics(risk_manager, daily_results, initial_capital)
+        results = self._calculate_metrics(risk_manager, daily_results[:n_days], initial_capital)
 
         return results
 
-    def _simulate_exit(self, signal: Dict, date: datetime) -> float:
+    def _execute_day(
+        self,
+        risk_manager: RiskManager,
+        signals: List[Dict],
+        exits: np.ndarray,
+        current_date: datetime
+    ) -> Tuple[float, int]:
         """
-        Simulate trade exit (simplified)
+        Execute a day's signals against the risk manager
+
+        This stays a sequential loop: position size depends on capital
+        after the previous trade, and the risk manager can stop trading
+        mid-day (max trades, consecutive losses).
+
+        Args:
+            risk_manager: RiskManager carrying state across days
+            signals: Trading signals for the day
+            exits: Simulated exit price per signal
+            current_date: Trading date
+
+        Returns:
+            Tuple of (day P&L, trades taken)
+        """
+        day_pnl = 0.0
+        trades_taken = 0
+
+        for signal, exit_price in zip(signals, exits.tolist()):
+            # Check if can take trade
+            can_trade, reason = risk_manager.can_take_trade()
+
+            if not can_trade:
+                logger.info("Cannot take trade: %s", reason)
+                break
+
+            # Validate signal and calculate position
+            is_valid, reason, position = PositionSizer.validate_signal(
+                signal,
+                risk_manager.capital,
+                self.config
+            )
+
+            if not is_valid:
+                logger.warning("Invalid signal for %s: %s", signal['symbol'], reason)
+                continue
+
+            # Add trade
+            trade = risk_manager.add_trade(
+                signal['symbol'],
+                signal,
+                position,
+                current_date
+            )
+
+            # Close trade at the pre-drawn exit price
+            closed_trade = risk_manager.close_trade(
+                trade['id'],
+                exit_price,
+                current_date
+            )
+
+            day_pnl += closed_trade['pnl']
+            trades_taken += 1
+
+        return day_pnl, trades_taken
+
+    def _simulate_exits(self, signals: List[Dict]) -> np.ndarray:
+        """
+        Simulate trade exits for a day's signals (simplified)
 
         In reality, you'd replay minute data to see if SL or target hit.
         For simplicity, we assume:
         - 60% probability of hitting target
         - 40% probability of hitting stop-loss
 
+        Targets and stops are gathered into arrays and all draws are made
+        in one call.
+
         Args:
-            signal: Trading signal
-            date: Trading date
+            signals: Trading signals for the day
 
         Returns:
-            Exit price
+            Array of exit prices, one per signal
         """
-        # Simple Monte Carlo simulation
-        hit_target = np.random.random() < 0.6
+        n = len(signals)
+        targets = np.fromiter((s['target'] for s in signals), dtype=np.float64, count=n)
+        stops = np.fromiter((s['stop_loss'] for s in signals), dtype=np.float64, count=n)
 
-        if hit_target:
-            return signal['target']
-        else:
-            return signal['stop_loss']
+        return np.where(self._rng.random(n) < 0.6, targets, stops)
+
+    def _load_symbol(self, symbol: str) -> pd.DataFrame:
+        """
+        Load full daily history for a symbol once per backtest
+
+        The pre-market screener slices this by date on each day instead
+        of re-reading the CSV.
+
+        Args:
+            symbol: Stock symbol
+
+        Returns:
+            DataFrame with daily OHLCV data indexed by date
+        """
+        history = self._daily_history.get(symbol)
+        if history is None:
+            history = self.pre_market_screener.data_loader.load_daily_data(symbol, lookback_days=None)
+            self._daily_history[symbol] = history
+        return history
+
+    def _run_one_day(self, current_date: datetime) -> Optional[Dict]:
+        """
+        Run screening, filtering and signal generation for one day
+
+        Does not touch risk manager state, so it is safe to run in a
+        worker process.
+
+        Args:
+            current_date: Trading date
+
+        Returns:
+            Dictionary with candidate counts and signals, or None on error
+        """
+        logger.info("\n" + "="*60)
+        logger.info("Backtesting: %s", current_date.date())
+        logger.info("="*60)
+
+        day_run = {
+            'pre_market_candidates': 0,
+            'live_market_candidates': 0,
+            'signals': []
+        }
+
+        try:
+            # Step 1: Pre-market screening
+            pre_market_candidates = self.pre_market_screener.run_screening(current_date)
+
+            if not pre_market_candidates:
+                logger.info("No pre-market candidates")
+                return day_run
+
+            day_run['pre_market_candidates'] = len(pre_market_candidates)
+
+            # Step 2: Live market filtering
+            live_market_candidates = self.live_market_filter.run_filtering(
+                pre_market_candidates,
+                current_date
+            )
+
+            if not live_market_candidates:
+                logger.info("No live market candidates")
+                return day_run
+
+            day_run['live_market_candidates'] = len(live_market_candidates)
+
+            # Step 3: Generate signals
+            signals = self.signal_generator.generate_signals(live_market_candidates)
+
+            if not signals:
+                logger.info("No signals generated")
+
+            day_run['signals'] = signals
+            return day_run
+
+        except Exception as e:
+            logger.error("Error on %s: %s", current_date.date(), e)
+            return None
 
     def _calculate_metrics(
         self,
         risk_manager: RiskManager,
-        daily_results: List[Dict],
+        daily_results: np.ndarray,
         initial_capital: float
     ) -> Dict:
         """
@@ -226,7 +428,7 @@ class BacktestEngine:
 
         Args:
             risk_manager: RiskManager instance
-            daily_results: List of daily results
+            daily_results: Structured array of daily results (DAILY_DT)
             initial_capital: Starting capital
 
         Returns:
@@ -235,43 +437,40 @@ class BacktestEngine:
         summary = risk_manager.get_summary()
         closed_trades = risk_manager.get_closed_trades()
 
-        # Daily P&L series
-        daily_pnl = [d['pnl'] for d in daily_results]
-        cumulative_pnl = np.cumsum(daily_pnl)
+        # Daily P&L series (a strided view into the structured array, no copy)
+        daily_pnl = daily_results['pnl']
 
-        # Calculate max drawdown
-        running_max = np.maximum.accumulate(cumulative_pnl)
-        drawdown = running_max - cumulative_pnl
-        max_drawdown = np.max(drawdown) if len(drawdown) > 0 else 0
+        # Max drawdown and P&L moments in one helper
+        max_drawdown, mean_pnl, std_pnl = _drawdown_stats(daily_pnl)
 
         # Calculate Sharpe ratio (simplified)
         if len(daily_pnl) > 1:
-            sharpe_ratio = np.mean(daily_pnl) / np.std(daily_pnl) * np.sqrt(252)
+            sharpe_ratio = mean_pnl / std_pnl * np.sqrt(252)
         else:
             sharpe_ratio = 0
 
         results = {
             'summary': summary,
             'total_days': len(daily_results),
-            'trading_days': sum(1 for d in daily_results if d['trades'] > 0),
-            'total_signals': sum(d['signals'] for d in daily_results),
-            'total_trades': sum(d['trades'] for d in daily_results),
+            'trading_days': int(np.count_nonzero(daily_results['trades'] > 0)),
+            'total_signals': int(daily_results['signals'].sum()),
+            'total_trades': int(daily_results['trades'].sum()),
             'max_drawdown': max_drawdown,
             'sharpe_ratio': sharpe_ratio,
-            'daily_results': daily_results,
+            'daily_results': _daily_records(daily_results),
             'trades': closed_trades
         }
 
         logger.info("\n" + "="*60)
         logger.info("BACKTEST RESULTS")
         logger.info("="*60)
-        logger.info(f"Total Days: {results['total_days']}")
-        logger.info(f"Trading Days: {results['trading_days']}")
-        logger.info(f"Total Trades: {results['total_trades']}")
-        logger.info(f"Win Rate: {summary['win_rate']:.2f}%")
+        logger.info("Total Days: %d", results['total_days'])
+        logger.info("Trading Days: %d", results['trading_days'])
+        logger.info("Total Trades: %d", results['total_trades'])
+        logger.info("Win Rate: %.2f%%", summary['win_rate'])
         logger.info(f"Total P&L: ₹{summary['total_pnl']:,.2f} ({summary['total_pnl_percent']:+.2f}%)")
         logger.info(f"Max Drawdown: ₹{max_drawdown:,.2f}")
-        logger.info(f"Sharpe Ratio: {sharpe_ratio:.2f}")
+        logger.info("Sharpe Ratio: %.2f", sharpe_ratio)
         logger.info("="*60)
 
         return results
@@ -11,14 +11,19 @@ from datetime import datetime
 from pathlib import Path
 import sys
 
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib json module
+    orjson = None
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from production.screener import PreMarketScreener, LiveMarketFilter
-from production.signal_engine import SignalGenerator
-from production.risk_manager import RiskManager, PositionSizer
-from production.backtester import BacktestEngine
-from production.data_ingest import DataValidator
+# Pipeline modules (pandas/numpy and friends) are imported inside the
+# cmd_* functions so that --help and argument errors stay fast
+
+# libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
 
 
 def setup_logging(level: str = 'INFO'):
@@ -36,26 +41,46 @@ def setup_logging(level: str = 'INFO'):
 def load_config(config_path: str) -> dict:
     """Load configuration from YAML file"""
     with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=YAML_LOADER)
     return config
 
 
 def save_results(results: dict, output_path: str):
-    """Save results to JSON file"""
+    """
+    Save results to JSON file
+
+    With orjson installed the output is not byte-identical to the stdlib
+    json path: NaN and +/-Infinity are written as null, and non-ASCII text
+    (e.g. the rupee sign) is written as UTF-8 instead of \\u escapes.
+    """
     # Convert datetime objects to strings
     def serialize(obj):
         if isinstance(obj, datetime):
             return obj.isoformat()
         raise TypeError(f"Type {type(obj)} not serializable")
 
-    with open(output_path, 'w') as f:
-        json.dump(results, f, indent=2, default=serialize)
+    if orjson is not None:
+        # Native datetime/numpy support; default only sees the leftovers.
+        # Non-str dict keys are stringified, as json.dump does
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(
+                results,
+                default=serialize,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(results, f, indent=2, default=serialize)
 
     print(f"\nResults saved to: {output_path}")
 
 
 def cmd_screen(args, config):
     """Run screening workflow"""
+    from production.screener import PreMarketScreener, LiveMarketFilter
+    from production.signal_engine import SignalGenerator
+    from production.risk_manager import RiskManager, PositionSizer
+
     date = datetime.strptime(args.date, '%Y-%m-%d')
     mode = args.mode
 
@@ -88,7 +113,7 @@ def cmd_screen(args, config):
             screener = PreMarketScreener(config)
             pre_market_candidates = screener.run_screening(date)
 
-        live_filter = LiveMarketFilter(config)
+        live_filter = LiveMarketFilter(config, data_loader=screener.data_loader)
         live_candidates = live_filter.run_filtering(pre_market_candidates, date)
 
         results['live_market_candidates'] = live_candidates
@@ -107,20 +132,17 @@ def cmd_screen(args, config):
         capital = args.capital
         risk_manager = RiskManager(capital, config)
 
+        # Size every signal against the same capital in one batch
+        validations = PositionSizer.validate_signals(signals, capital, config)
+
         validated_signals = []
-        for signal in signals:
-            can_trade, reason = risk_manager.can_take_trade()
+        for signal, (is_valid, reason, position) in zip(signals, validations):
+            can_trade, trade_reason = risk_manager.can_take_trade()
 
             if not can_trade:
-                print(f"\n⚠️  Cannot take more trades: {reason}")
+                print(f"\n⚠️  Cannot take more trades: {trade_reason}")
                 break
 
-            is_valid, reason, position = PositionSizer.validate_signal(
-                signal,
-                capital,
-                config
-            )
-
             if is_valid:
                 signal['position'] = position
                 validated_signals.append(signal)
@@ -151,6 +173,8 @@ def cmd_screen(args, config):
 
 def cmd_backtest(args, config):
     """Run backtest"""
+    from production.backtester import BacktestEngine
+
     start_date = datetime.strptime(args.start, '%Y-%m-%d')
     end_date = datetime.strptime(args.end, '%Y-%m-%d')
     capital = args.capital
@@ -172,17 +196,13 @@ def cmd_backtest(args, config):
 
 def cmd_validate_data(args, config):
     """Validate data integrity"""
-    from production.data_ingest import CSVDataLoader
+    from production.data_ingest import CSVDataLoader, CSVSourceConfig, DataValidator
 
     print(f"\n{'='*60}")
     print("VALIDATING DATA")
     print(f"{'='*60}\n")
 
-    loader = CSVDataLoader(
-        minute_data_dir=config['data']['csv']['minute_data_dir'],
-        daily_data_dir=config['data']['csv']['daily_data_dir'],
-        timezone=config['market']['timezone']
-    )
+    loader = CSVDataLoader.from_source(CSVSourceConfig.from_config(config))
 
     symbols = config['universe']['stocks'][:5]  # Test first 5 stocks
 
@@ -1,6 +1,6 @@
 """Data ingestion and validation modules"""
 
-from .csv_loader import CSVDataLoader
+from .csv_loader import CSVDataLoader, CSVSourceConfig
 from .data_validator import DataValidator
 
-__all__ = ["CSVDataLoader", "DataValidator"]
+__all__ = ["CSVDataLoader", "CSVSourceConfig", "DataValidator"]
@@ -3,16 +3,79 @@ CSV Data Loader
 Loads minute and daily OHLCV data from CSV files
 """
 
+import json
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Callable, Dict, Optional, List, Tuple
 from datetime import datetime
 import pytz
 import logging
 
+from .data_validator import OHLCV_COLUMNS, OHLCV_COLUMN_SET
+
 logger = logging.getLogger(__name__)
 
+# pyarrow's multithreaded CSV parser when available, else pandas' C parser;
+# the parquet sidecar cache also needs pyarrow
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    pa = pq = None
+    CSV_ENGINE = 'c'
+
+# Declared price dtypes skip type inference; volume is left inferred
+PRICE_DTYPES = {'open': np.float64, 'high': np.float64, 'low': np.float64, 'close': np.float64}
+
+DEFAULT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Parquet schema metadata key holding the source file and parse settings
+# a sidecar cache was built from; the cache is used only on an exact match
+CACHE_SOURCE_KEY = b'st_ml.source'
+
+# Index resolution of loaded frames, whether parsed or read from cache
+INDEX_UNIT = 'ns'
+
+
+@dataclass(frozen=True)
+class CSVSourceConfig:
+    """CSV data source settings, resolved once from the YAML config"""
+
+    minute_data_dir: str
+    daily_data_dir: str
+    timezone: str = "Asia/Kolkata"
+    date_format: str = DEFAULT_DATE_FORMAT
+    max_workers: Optional[int] = None
+    price_dtype: str = 'float64'
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "CSVSourceConfig":
+        """
+        Build from the screener configuration dictionary
+
+        Args:
+            config: Configuration dictionary from YAML
+
+        Returns:
+            CSVSourceConfig instance
+        """
+        csv_config = config['data']['csv']
+        return cls(
+            minute_data_dir=csv_config['minute_data_dir'],
+            daily_data_dir=csv_config['daily_data_dir'],
+            timezone=config['market']['timezone'],
+            date_format=config['data'].get('date_format', DEFAULT_DATE_FORMAT),
+            max_workers=csv_config.get('max_workers'),
+            price_dtype=csv_config.get('price_dtype', 'float64')
+        )
+
 
 class CSVDataLoader:
     """
@@ -28,7 +91,9 @@ class CSVDataLoader:
         minute_data_dir: str,
         daily_data_dir: str,
         timezone: str = "Asia/Kolkata",
-        date_format: str = "%Y-%m-%d %H:%M:%S"
+        date_format: str = DEFAULT_DATE_FORMAT,
+        max_workers: Optional[int] = None,
+        price_dtype: str = 'float64'
     ):
         """
         Initialize CSV data loader
@@ -38,13 +103,35 @@ class CSVDataLoader:
             daily_data_dir: Directory containing daily CSV files
             timezone: Exchange timezone
             date_format: Date format in CSV files
+            max_workers: Threads for multi-symbol loads (None = one per symbol, up to 32)
+            price_dtype: In-memory dtype of the OHLC columns ('float64' or 'float32')
         """
         self.minute_data_dir = Path(minute_data_dir)
         self.daily_data_dir = Path(daily_data_dir)
         self.timezone = pytz.timezone(timezone)
         self.date_format = date_format
+        self.max_workers = max_workers
+        self.price_dtype = np.dtype(price_dtype)
+
+        # Parsed frames per CSV file as (mtime_ns, frame); holds every file
+        # of the universe until clear_cache()
+        self._frames: Dict[Path, Tuple[int, pd.DataFrame]] = {}
+        self._frames_lock = threading.Lock()
 
-        logger.info(f"CSV Loader initialized with minute_dir={minute_data_dir}, daily_dir={daily_data_dir}")
+        logger.info("CSV Loader initialized with minute_dir=%s, daily_dir=%s", minute_data_dir, daily_data_dir)
+
+    @classmethod
+    def from_source(cls, source: CSVSourceConfig) -> "CSVDataLoader":
+        """
+        Create a loader from parsed CSV source settings
+
+        Args:
+            source: CSVSourceConfig instance
+
+        Returns:
+            CSVDataLoader instance
+        """
+        return cls(**asdict(source))
 
     def load_minute_data(
         self,
@@ -66,23 +153,11 @@ class CSVDataLoader:
         file_path = self.minute_data_dir / f"{symbol}_minute.csv"
 
         if not file_path.exists():
-            logger.warning(f"Minute data file not found: {file_path}")
+            logger.warning("Minute data file not found: %s", file_path)
             return pd.DataFrame()
 
         try:
-            df = pd.read_csv(file_path)
-
-            # Parse timestamp
-            df['timestamp'] = pd.to_datetime(df['timestamp'], format=self.date_format)
-
-            # Localize to timezone if naive
-            if df['timestamp'].dt.tz is None:
-                df['timestamp'] = df['timestamp'].dt.tz_localize(self.timezone)
-            else:
-                df['timestamp'] = df['timestamp'].dt.tz_convert(self.timezone)
-
-            # Set as index
-            df = df.set_index('timestamp').sort_index()
+            df = self._read_cached(file_path, self._parse_minute_csv)
 
             # Filter by date range if provided
             if start_date:
@@ -91,28 +166,27 @@ class CSVDataLoader:
                 df = df[df.index <= end_date]
 
             # Ensure required columns
-            required_cols = ['open', 'high', 'low', 'close', 'volume']
-            if not all(col in df.columns for col in required_cols):
-                raise ValueError(f"Missing required columns. Expected: {required_cols}")
+            if not OHLCV_COLUMN_SET.issubset(df.columns):
+                raise ValueError(f"Missing required columns. Expected: {list(OHLCV_COLUMNS)}")
 
-            logger.info(f"Loaded {len(df)} minute candles for {symbol}")
-            return df[required_cols]
+            logger.info("Loaded %d minute candles for %s", len(df), symbol)
+            return df[list(OHLCV_COLUMNS)]
 
         except Exception as e:
-            logger.error(f"Error loading minute data for {symbol}: {e}")
+            logger.error("Error loading minute data for %s: %s", symbol, e)
             return pd.DataFrame()
 
     def load_daily_data(
         self,
         symbol: str,
-        lookback_days: int = 250
+        lookback_days: Optional[int] = 250
     ) -> pd.DataFrame:
         """
         Load daily OHLCV data for a symbol
 
         Args:
             symbol: Stock symbol
-            lookback_days: Number of days to load
+            lookback_days: Number of days to load (None for full history)
 
         Returns:
             DataFrame with daily OHLCV data
@@ -120,30 +194,191 @@ class CSVDataLoader:
         file_path = self.daily_data_dir / f"{symbol}_daily.csv"
 
         if not file_path.exists():
-            logger.warning(f"Daily data file not found: {file_path}")
+            logger.warning("Daily data file not found: %s", file_path)
             return pd.DataFrame()
 
         try:
-            df = pd.read_csv(file_path)
-
-            # Parse date
-            df['date'] = pd.to_datetime(df['date'], format="%Y-%m-%d")
-            df = df.set_index('date').sort_index()
+            df = self._read_cached(file_path, self._parse_daily_csv)
 
             # Take last N days
-            df = df.tail(lookback_days)
+            if lookback_days is not None:
+                df = df.tail(lookback_days)
 
-            required_cols = ['open', 'high', 'low', 'close', 'volume']
-            if not all(col in df.columns for col in required_cols):
-                raise ValueError(f"Missing required columns. Expected: {required_cols}")
+            if not OHLCV_COLUMN_SET.issubset(df.columns):
+                raise ValueError(f"Missing required columns. Expected: {list(OHLCV_COLUMNS)}")
 
-            logger.info(f"Loaded {len(df)} daily candles for {symbol}")
-            return df[required_cols]
+            logger.info("Loaded %d daily candles for %s", len(df), symbol)
+            return df[list(OHLCV_COLUMNS)]
 
         except Exception as e:
-            logger.error(f"Error loading daily data for {symbol}: {e}")
+            logger.error("Error loading daily data for %s: %s", symbol, e)
             return pd.DataFrame()
 
+    def _parse_minute_csv(self, file_path: Path) -> pd.DataFrame:
+        """Parse a minute CSV into a timezone-aware, sorted DataFrame"""
+        # pyarrow parses ISO timestamps natively, skipping the string
+        # round trip; custom formats still go through to_datetime below
+        native_timestamps = CSV_ENGINE == 'pyarrow' and self.date_format == DEFAULT_DATE_FORMAT
+
+        df = pd.read_csv(
+            file_path,
+            engine=CSV_ENGINE,
+            usecols=['timestamp', *OHLCV_COLUMNS],
+            dtype=PRICE_DTYPES if native_timestamps else {'timestamp': str, **PRICE_DTYPES}
+        )
+
+        # Parse timestamp (a no-op when already parsed; cache dedupes repeats)
+        df['timestamp'] = pd.to_datetime(df['timestamp'], format=self.date_format, cache=True)
+
+        # Localize to timezone if naive
+        if df['timestamp'].dt.tz is None:
+            df['timestamp'] = df['timestamp'].dt.tz_localize(self.timezone)
+        else:
+            df['timestamp'] = df['timestamp'].dt.tz_convert(self.timezone)
+
+        # Set as index
+        return df.set_index('timestamp').sort_index()
+
+    def _parse_daily_csv(self, file_path: Path) -> pd.DataFrame:
+        """Parse a daily CSV into a date-indexed, sorted DataFrame"""
+        df = pd.read_csv(
+            file_path,
+            engine=CSV_ENGINE,
+            usecols=['date', *OHLCV_COLUMNS],
+            dtype={'date': str, **PRICE_DTYPES}
+        )
+
+        # Parse date
+        df['date'] = pd.to_datetime(df['date'], format="%Y-%m-%d", cache=True)
+        return df.set_index('date').sort_index()
+
+    def _read_cached(
+        self,
+        file_path: Path,
+        parse: Callable[[Path], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """
+        Read a CSV through an in-memory and a sibling parquet cache
+
+        Parsed frames are kept in memory per file (invalidated when the
+        file's mtime changes), so the filter stages reading the same symbol
+        share one load. On a miss, the parquet file is used if it was built
+        from this exact CSV (mtime and size) with the same date format and
+        timezone; otherwise the CSV is parsed and the cache rewritten.
+
+        Args:
+            file_path: Path to the CSV file
+            parse: Function parsing the CSV into an indexed DataFrame
+
+        Returns:
+            Parsed DataFrame (shared, do not modify; callers slice it)
+        """
+        mtime_ns = file_path.stat().st_mtime_ns
+
+        with self._frames_lock:
+            entry = self._frames.get(file_path)
+        if entry is not None and entry[0] == mtime_ns:
+            return entry[1]
+
+        df = self._read_frame(file_path, parse)
+
+        with self._frames_lock:
+            self._frames[file_path] = (mtime_ns, df)
+        return df
+
+    def _read_frame(
+        self,
+        file_path: Path,
+        parse: Callable[[Path], pd.DataFrame]
+    ) -> pd.DataFrame:
+        """
+        Uncached body of _read_cached
+
+        Args:
+            file_path: Path to the CSV file
+            parse: Function parsing the CSV into an indexed DataFrame
+
+        Returns:
+            Parsed DataFrame, OHLC columns in the configured price dtype
+        """
+        cache_path = file_path.with_suffix('.parquet')
+        source = self._cache_source(file_path)
+        df = None
+
+        if pq is not None and cache_path.exists():
+            try:
+                # Project to the OHLCV columns; the index is restored from metadata
+                table = pq.read_table(cache_path, columns=list(OHLCV_COLUMNS), use_pandas_metadata=True)
+                if (table.schema.metadata or {}).get(CACHE_SOURCE_KEY) == source:
+                    df = table.to_pandas()
+            except Exception as e:
+                logger.warning("Ignoring unreadable cache %s: %s", cache_path, e)
+
+        if df is None:
+            df = parse(file_path)
+            df.index = df.index.as_unit(INDEX_UNIT)
+
+            # The on-disk cache always keeps full float64 precision
+            if pq is not None:
+                try:
+                    self._write_parquet(df, cache_path, source)
+                except Exception as e:
+                    logger.warning("Could not write cache %s: %s", cache_path, e)
+        else:
+            df.index = df.index.as_unit(INDEX_UNIT)
+
+        if self.price_dtype != np.float64:
+            df = df.astype(dict.fromkeys(PRICE_DTYPES, self.price_dtype))
+
+        return df
+
+    def _cache_source(self, file_path: Path) -> bytes:
+        """
+        Identify a CSV file and the settings it is parsed with
+
+        Args:
+            file_path: Path to the CSV file
+
+        Returns:
+            JSON-encoded source key stored in the parquet cache metadata
+        """
+        stat = file_path.stat()
+        return json.dumps({
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'date_format': self.date_format,
+            'timezone': self.timezone.zone
+        }, sort_keys=True).encode()
+
+    @staticmethod
+    def _write_parquet(df: pd.DataFrame, cache_path: Path, source: bytes) -> None:
+        """
+        Atomically write a parquet cache file
+
+        Loader threads and backtest worker processes may write the same
+        cache concurrently, so the frame goes to a temporary file in the
+        same directory and is renamed into place.
+
+        Args:
+            df: Frame to cache
+            cache_path: Destination parquet file
+            source: Source key from _cache_source, stored in the schema metadata
+        """
+        table = pa.Table.from_pandas(df)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), CACHE_SOURCE_KEY: source})
+
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.stem, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pq.write_table(table, f, compression='zstd')
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
     def get_previous_close(self, symbol: str, date: datetime) -> Optional[float]:
         """
         Get previous day's closing price
@@ -161,13 +396,23 @@ class CSVDataLoader:
             return None
 
         # Find the close before the given date
-        prev_data = daily_data[daily_data.index < date.date()]
+        prev_data = daily_data[daily_data.index < pd.Timestamp(date.date())]
 
         if prev_data.empty:
             return None
 
         return prev_data['close'].iloc[-1]
 
+    def clear_cache(self) -> None:
+        """
+        Drop the in-memory data caches, e.g. on date rollover
+
+        Entries are already invalidated when a file changes; this only
+        releases memory.
+        """
+        with self._frames_lock:
+            self._frames.clear()
+
     def load_news_data(self, news_file: str) -> pd.DataFrame:
         """
         Load news/events data
@@ -185,17 +430,19 @@ class CSVDataLoader:
         file_path = Path(news_file)
 
         if not file_path.exists():
-            logger.warning(f"News file not found: {file_path}")
+            logger.warning("News file not found: %s", file_path)
             return pd.DataFrame()
 
         try:
-            df = pd.read_csv(file_path)
+            # Dates kept as text so to_datetime parses them the same way
+            # under either engine
+            df = pd.read_csv(file_path, engine=CSV_ENGINE, dtype={'date': str})
             df['date'] = pd.to_datetime(df['date'])
-            logger.info(f"Loaded {len(df)} news items")
+            logger.info("Loaded %d news items", len(df))
             return df
 
         except Exception as e:
-            logger.error(f"Error loading news data: {e}")
+            logger.error("Error loading news data: %s", e)
             return pd.DataFrame()
 
     def load_all_symbols(
@@ -215,20 +462,89 @@ class CSVDataLoader:
         Returns:
             Dictionary mapping symbol to DataFrame
         """
-        data = {}
-
-        for symbol in symbols:
-            if minute:
-                df = self.load_minute_data(
+        if minute:
+            def load(symbol):
+                return self.load_minute_data(
                     symbol,
                     start_date=date.replace(hour=0, minute=0, second=0),
                     end_date=date.replace(hour=23, minute=59, second=59)
                 )
-            else:
-                df = self.load_daily_data(symbol)
+        else:
+            load = self.load_daily_data
 
-            if not df.empty:
-                data[symbol] = df
+        frames = self._map_symbols(load, symbols)
+        data = {symbol: df for symbol, df in zip(symbols, frames) if not df.empty}
 
-        logger.info(f"Loaded data for {len(data)}/{len(symbols)} symbols")
+        logger.info("Loaded data for %d/%d symbols", len(data), len(symbols))
         return data
+
+    def load_many_daily(
+        self,
+        symbols: List[str],
+        lookback_days: Optional[int] = 250,
+        column: str = 'close'
+    ) -> pd.DataFrame:
+        """
+        Load one daily column for many symbols as a single wide DataFrame
+
+        Each symbol keeps its own last lookback_days bars; the frames are
+        aligned on date, so a symbol without a bar on some date is NaN there.
+
+        Args:
+            symbols: List of symbols
+            lookback_days: Number of days to load per symbol (None for full history)
+            column: OHLCV column to collect
+
+        Returns:
+            DataFrame indexed by date with one column per symbol found
+        """
+        frames = self._map_symbols(
+            lambda symbol: self.load_daily_data(symbol, lookback_days=lookback_days),
+            symbols
+        )
+        columns = {symbol: df[column] for symbol, df in zip(symbols, frames) if not df.empty}
+
+        if not columns:
+            return pd.DataFrame()
+
+        return pd.DataFrame(columns)
+
+    def prefetch(self, symbols: List[str], minute: bool = True, daily: bool = True) -> None:
+        """
+        Read the data files of many symbols in one parallel batch
+
+        Every daily and minute file read is submitted at once, so cold-start
+        disk latency overlaps instead of being paid stage by stage; later
+        loads for these symbols are served from the in-memory cache.
+        Missing or unreadable files are skipped here and reported by the
+        regular loaders.
+
+        Args:
+            symbols: List of symbols
+            minute: Prefetch minute data files
+            daily: Prefetch daily data files
+        """
+        jobs = []
+        if daily:
+            jobs += [(self.daily_data_dir / f"{symbol}_daily.csv", self._parse_daily_csv) for symbol in symbols]
+        if minute:
+            jobs += [(self.minute_data_dir / f"{symbol}_minute.csv", self._parse_minute_csv) for symbol in symbols]
+
+        def read(job):
+            file_path, parse = job
+            try:
+                if file_path.exists():
+                    self._read_cached(file_path, parse)
+            except Exception as e:
+                logger.debug("Prefetch failed for %s: %s", file_path, e)
+
+        max_workers = self.max_workers or min(32, len(jobs) or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(read, jobs))
+
+    def _map_symbols(self, load: Callable[[str], pd.DataFrame], symbols: List[str]) -> List[pd.DataFrame]:
+        """Run a per-symbol load for every symbol on a thread pool, in order"""
+        # File reads and CSV/parquet parsing release the GIL, so threads overlap
+        max_workers = self.max_workers or min(32, len(symbols) or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(load, symbols))
@@ -10,6 +10,42 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Required OHLCV columns, in output order and as a set for membership checks
+OHLCV_COLUMNS = ('open', 'high', 'low', 'close', 'volume')
+OHLCV_COLUMN_SET = frozenset(OHLCV_COLUMNS)
+
+
+def _outlier_mask(values: np.ndarray, std_threshold: float) -> np.ndarray:
+    """
+    Flag bars whose return deviates from the mean return by more than
+    std_threshold sample standard deviations
+
+    Args:
+        values: Price array (float64)
+        std_threshold: Number of standard deviations
+
+    Returns:
+        Boolean mask aligned with values (first bar is never flagged)
+    """
+    if len(values) < 2:
+        return np.zeros(len(values), dtype=bool)
+
+    # Returns computed in one preallocated buffer (same as pct_change)
+    returns = np.empty_like(values)
+    returns[0] = np.nan
+    with np.errstate(divide='ignore', invalid='ignore'):
+        np.divide(values[1:], values[:-1], out=returns[1:])
+    returns[1:] -= 1
+
+    valid = returns[~np.isnan(returns)]
+    if len(valid) < 2:
+        return np.zeros(len(values), dtype=bool)
+
+    with np.errstate(invalid='ignore'):
+        mean_return = valid.mean()
+        std_return = valid.std(ddof=1)
+        return np.abs(returns - mean_return) > std_threshold * std_return
+
 
 class DataValidator:
     """Validates OHLCV data for integrity and quality"""
@@ -36,44 +72,36 @@ class DataValidator:
         errors = []
 
         # Check required columns
-        required_cols = ['open', 'high', 'low', 'close', 'volume']
-        missing_cols = [col for col in required_cols if col not in df.columns]
-
-        if missing_cols:
+        if not OHLCV_COLUMN_SET.issubset(df.columns):
+            missing_cols = [col for col in OHLCV_COLUMNS if col not in df.columns]
             errors.append(f"Missing columns: {missing_cols}")
             return False, errors
 
+        # Pull each column out once as a float64 array; every check below
+        # is a count over raw arrays, no masked DataFrames are built
+        o, h, l, c, v = (
+            df[col].to_numpy(dtype=np.float64, na_value=np.nan) for col in OHLCV_COLUMNS
+        )
+
         # Check for missing values
-        for col in required_cols:
-            if df[col].isna().any():
-                na_count = df[col].isna().sum()
+        for col, values in zip(OHLCV_COLUMNS, (o, h, l, c, v)):
+            na_count = np.count_nonzero(np.isnan(values))
+            if na_count:
                 errors.append(f"Column '{col}' has {na_count} missing values")
 
-        # Check OHLC relationships
-        invalid_hl = df[df['high'] < df['low']]
-        if len(invalid_hl) > 0:
-            errors.append(f"{len(invalid_hl)} candles where High < Low")
-
-        invalid_ho = df[df['high'] < df['open']]
-        if len(invalid_ho) > 0:
-            errors.append(f"{len(invalid_ho)} candles where High < Open")
-
-        invalid_hc = df[df['high'] < df['close']]
-        if len(invalid_hc) > 0:
-            errors.append(f"{len(invalid_hc)} candles where High < Close")
-
-        invalid_lo = df[df['low'] > df['open']]
-        if len(invalid_lo) > 0:
-            errors.append(f"{len(invalid_lo)} candles where Low > Open")
-
-        invalid_lc = df[df['low'] > df['close']]
-        if len(invalid_lc) > 0:
-            errors.append(f"{len(invalid_lc)} candles where Low > Close")
-
-        # Check volume
-        invalid_vol = df[df['volume'] < 0]
-        if len(invalid_vol) > 0:
-            errors.append(f"{len(invalid_vol)} candles with negative volume")
+        # Check OHLC relationships and volume
+        checks = (
+            (h < l, "candles where High < Low"),
+            (h < o, "candles where High < Open"),
+            (h < c, "candles where High < Close"),
+            (l > o, "candles where Low > Open"),
+            (l > c, "candles where Low > Close"),
+            (v < 0, "candles with negative volume"),
+        )
+        for mask, message in checks:
+            count = np.count_nonzero(mask)
+            if count:
+                errors.append(f"{count} {message}")
 
         is_valid = len(errors) == 0
         return is_valid, errors
@@ -93,22 +121,26 @@ class DataValidator:
         if len(df) < 2:
             return []
 
-        gaps = []
         expected_delta = pd.Timedelta(minutes=expected_interval_minutes)
 
-        for i in range(1, len(df)):
-            actual_delta = df.index[i] - df.index[i-1]
-
-            if actual_delta > expected_delta * 1.5:  # Allow 50% tolerance
-                gaps.append({
-                    'start': df.index[i-1],
-                    'end': df.index[i],
-                    'duration': actual_delta,
-                    'expected': expected_delta
-                })
+        # All consecutive deltas in one vectorized subtraction; only the
+        # (usually few) gaps are materialized as dicts
+        index = df.index
+        deltas = index[1:] - index[:-1]
+        gap_positions = np.flatnonzero(deltas > expected_delta * 1.5)  # Allow 50% tolerance
+
+        gaps = [
+            {
+                'start': index[i],
+                'end': index[i + 1],
+                'duration': deltas[i],
+                'expected': expected_delta
+            }
+            for i in gap_positions
+        ]
 
         if gaps:
-            logger.warning(f"Found {len(gaps)} time gaps in data")
+            logger.warning("Found %d time gaps in data", len(gaps))
 
         return gaps
 
@@ -128,14 +160,11 @@ class DataValidator:
         if column not in df.columns:
             return pd.DataFrame()
 
-        returns = df[column].pct_change()
-        mean_return = returns.mean()
-        std_return = returns.std()
-
-        outliers = df[np.abs(returns - mean_return) > std_threshold * std_return]
+        values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+        outliers = df[_outlier_mask(values, std_threshold)]
 
         if len(outliers) > 0:
-            logger.warning(f"Found {len(outliers)} outliers in {column}")
+            logger.warning("Found %d outliers in %s", len(outliers), column)
 
         return outliers
 
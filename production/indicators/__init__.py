@@ -1,7 +1,8 @@
 """Technical indicators module"""
 
-from .ema import EMA
+from .ema import EMA, Trend
 from .vwap import VWAP
 from .atr import ATR
+from .trend import TrendIndicators
 
-__all__ = ["EMA", "VWAP", "ATR"]
+__all__ = ["EMA", "Trend", "VWAP", "ATR", "TrendIndicators"]
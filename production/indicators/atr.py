@@ -5,6 +5,10 @@ Average True Range (ATR) Indicator
 import pandas as pd
 import numpy as np
 
+# ATR% bucket edges and labels for get_volatility_levels (last label = NaN)
+VOLATILITY_EDGES = np.array([1.0, 2.0])
+VOLATILITY_LABELS = np.array(['low', 'medium', 'high', 'unknown'])
+
 
 class ATR:
     """Average True Range calculator for volatility measurement"""
@@ -31,22 +35,50 @@ class ATR:
         if len(df) < period:
             return pd.Series(index=df.index, dtype=float)
 
-        high = df['high']
-        low = df['low']
-        close = df['close']
+        high = df['high'].to_numpy(dtype=np.float64)
+        low = df['low'].to_numpy(dtype=np.float64)
+        close = df['close'].to_numpy(dtype=np.float64)
 
-        # Calculate True Range components
-        tr1 = high - low
-        tr2 = (high - close.shift()).abs()
-        tr3 = (low - close.shift()).abs()
+        return pd.Series(ATR.calculate_from_arrays(high, low, close, period), index=df.index)
 
-        # True Range is the maximum of the three
-        true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    @staticmethod
+    def calculate_from_arrays(
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        period: int = 14
+    ) -> np.ndarray:
+        """
+        Calculate Average True Range from raw float64 arrays
 
-        # ATR is the moving average of True Range
-        atr = true_range.ewm(span=period, adjust=False).mean()
+        Args:
+            high: High prices
+            low: Low prices
+            close: Close prices
+            period: ATR period (default 14)
 
-        return atr
+        Returns:
+            Array with ATR values (all NaN if shorter than period)
+        """
+        if len(close) < period:
+            return np.full(len(close), np.nan)
+
+        # Previous close, built once from the array (no shifted Series)
+        prev_close = np.empty_like(close)
+        prev_close[0] = np.nan
+        prev_close[1:] = close[:-1]
+
+        # True Range is the maximum of the three components, folded in place
+        # into two buffers; fmax skips the NaN previous close on the first bar
+        true_range = high - low
+        gap = np.abs(high - prev_close)
+        np.fmax(true_range, gap, out=true_range)
+        np.subtract(low, prev_close, out=gap)
+        np.abs(gap, out=gap)
+        np.fmax(true_range, gap, out=true_range)
+
+        # ATR is the moving average of True Range
+        return pd.Series(true_range).ewm(span=period, adjust=False).mean().to_numpy()
 
     @staticmethod
     def calculate_stop_loss(
@@ -100,3 +132,27 @@ class ATR:
             return 'medium'
         else:
             return 'high'
+
+    @staticmethod
+    def get_volatility_levels(atr: np.ndarray, price: np.ndarray) -> np.ndarray:
+        """
+        Vectorized get_volatility_level for many symbols at once
+
+        Args:
+            atr: Array of ATR values
+            price: Array of current prices
+
+        Returns:
+            Array of 'low', 'medium', 'high' or 'unknown' labels
+        """
+        atr = np.asarray(atr, dtype=np.float64)
+        price = np.asarray(price, dtype=np.float64)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            atr_percent = np.where(price == 0, np.nan, atr / price * 100)
+
+        # Bucket edges match the scalar version: < 1.0, < 2.0, else high
+        buckets = np.searchsorted(VOLATILITY_EDGES, atr_percent, side='right')
+        buckets[np.isnan(atr_percent)] = len(VOLATILITY_LABELS) - 1
+
+        return VOLATILITY_LABELS[buckets]
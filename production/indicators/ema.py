@@ -4,9 +4,22 @@ Exponential Moving Average (EMA) Indicator
 
 import pandas as pd
 import numpy as np
+from enum import IntEnum
 from typing import Union
 
 
+class Trend(IntEnum):
+    """Trend codes; each code indexes TREND_LABELS"""
+    DOWN = 0
+    SIDE = 1
+    UP = 2
+
+
+# Labels indexed by Trend code
+TREND_LABELS = np.array(['downtrend', 'sideways', 'uptrend'])
+TREND_CODES = {label: Trend(code) for code, label in enumerate(TREND_LABELS.tolist())}
+
+
 class EMA:
     """Exponential Moving Average calculator"""
 
@@ -33,6 +46,58 @@ class EMA:
         ema = data.ewm(span=period, adjust=adjust).mean()
         return ema
 
+    @staticmethod
+    def calculate_last(data: pd.Series, period: int) -> float:
+        """
+        Calculate only the latest EMA value
+
+        The adjust=False recurrence unrolled into one weighted sum,
+        EMA_n = (1-a)^n * x_0 + sum(a * (1-a)^(n-k) * x_k), so no EMA
+        series is built. Matches calculate(data, period).iloc[-1] to
+        floating-point rounding.
+
+        Args:
+            data: Price series (typically 'close')
+            period: EMA period
+
+        Returns:
+            Latest EMA value (NaN if fewer than period values)
+        """
+        if len(data) < period:
+            return np.nan
+
+        values = data.to_numpy(dtype=np.float64, na_value=np.nan)
+
+        # Missing values change the recurrence; leave them to pandas
+        if np.isnan(values).any():
+            return EMA.calculate(data, period).iloc[-1]
+
+        alpha = 2 / (period + 1)
+        weights = (1 - alpha) ** np.arange(len(values) - 1, -1, -1, dtype=np.float64)
+        weights[1:] *= alpha
+
+        return float(weights @ values)
+
+    @staticmethod
+    def update(prev_ema: float, value: float, period: int) -> float:
+        """
+        Advance an EMA by one new value in O(1)
+
+        Same adjust=False recurrence as calculate(), for callers that keep
+        a running EMA over an ever-growing series (seed it with
+        calculate_last on the history so far).
+
+        Args:
+            prev_ema: EMA up to the previous value
+            value: New price
+            period: EMA period
+
+        Returns:
+            Updated EMA value
+        """
+        alpha = 2 / (period + 1)
+        return alpha * value + (1 - alpha) * prev_ema
+
     @staticmethod
     def calculate_on_dataframe(
         df: pd.DataFrame,
@@ -50,13 +115,22 @@ class EMA:
         Returns:
             DataFrame with EMA columns added
         """
-        result = df.copy()
-
-        for period in periods:
-            col_name = f'ema_{period}'
-            result[col_name] = EMA.calculate(df[column], period)
-
-        return result
+        source = df[column]
+        col_names = [f'ema_{period}' for period in periods]
+
+        # Fill one preallocated block, then attach it with a single concat
+        # instead of inserting (and re-consolidating) one column at a time
+        emas = np.full((len(df), len(periods)), np.nan, order='F')
+        for j, period in enumerate(periods):
+            emas[:, j] = EMA.calculate(source, period).to_numpy(dtype=np.float64)
+
+        return pd.concat(
+            [
+                df.drop(columns=[c for c in col_names if c in df.columns]),
+                pd.DataFrame(emas, index=df.index, columns=col_names)
+            ],
+            axis=1
+        )
 
     @staticmethod
     def get_trend(
@@ -84,3 +158,51 @@ class EMA:
             return 'downtrend'
         else:
             return 'sideways'
+
+    @staticmethod
+    def get_trends(
+        current_price: np.ndarray,
+        ema_fast: np.ndarray,
+        ema_slow: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized get_trend for many symbols at once
+
+        Args:
+            current_price: Array of current prices
+            ema_fast: Array of fast EMA values
+            ema_slow: Array of slow EMA values
+
+        Returns:
+            Array of 'uptrend', 'downtrend' or 'sideways' labels
+        """
+        return TREND_LABELS[EMA.get_trend_codes(current_price, ema_fast, ema_slow)]
+
+    @staticmethod
+    def get_trend_codes(
+        current_price: np.ndarray,
+        ema_fast: np.ndarray,
+        ema_slow: np.ndarray
+    ) -> np.ndarray:
+        """
+        get_trends as int8 Trend codes, for comparing and sorting
+
+        Args:
+            current_price: Array of current prices
+            ema_fast: Array of fast EMA values
+            ema_slow: Array of slow EMA values
+
+        Returns:
+            Array of Trend codes
+        """
+        price = np.asarray(current_price, dtype=np.float64)
+        fast = np.asarray(ema_fast, dtype=np.float64)
+        slow = np.asarray(ema_slow, dtype=np.float64)
+
+        # NaN fails every comparison, so missing EMAs fall through to sideways
+        up = (price > fast) & (fast > slow)
+        down = (price < fast) & (fast < slow)
+        codes = up.astype(np.int8) - down.astype(np.int8)
+        codes += Trend.SIDE
+
+        return codes
@@ -0,0 +1,55 @@
+"""
+Trend Indicators
+Fast/slow EMA, VWAP and ATR computed together for the live trend filter
+"""
+
+import pandas as pd
+import numpy as np
+
+from .ema import EMA
+from .vwap import VWAP
+from .atr import ATR
+
+# Output column names; these are the columns the signal engine reads
+TREND_INDICATOR_COLUMNS = ('ema_20', 'ema_200', 'vwap', 'atr')
+
+
+class TrendIndicators:
+    """Computes the trend filter indicators in one call"""
+
+    @staticmethod
+    def calculate(
+        df: pd.DataFrame,
+        ema_fast: int,
+        ema_slow: int,
+        atr_period: int = 14
+    ) -> pd.DataFrame:
+        """
+        Calculate fast EMA, slow EMA, VWAP and ATR
+
+        Each OHLCV column is converted to an array once and shared by all
+        four indicators, and the results are written into one preallocated
+        block. Values match EMA.calculate, VWAP.calculate and ATR.calculate.
+
+        Args:
+            df: DataFrame with OHLCV data
+            ema_fast: Fast EMA period (stored as 'ema_20')
+            ema_slow: Slow EMA period (stored as 'ema_200')
+            atr_period: ATR period (default 14)
+
+        Returns:
+            DataFrame with TREND_INDICATOR_COLUMNS, aligned with df
+        """
+        high, low, close, volume = (
+            df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            for col in ('high', 'low', 'close', 'volume')
+        )
+        close_series = pd.Series(close)
+
+        indicators = np.empty((len(df), len(TREND_INDICATOR_COLUMNS)), order='F')
+        indicators[:, 0] = EMA.calculate(close_series, ema_fast).to_numpy(dtype=np.float64)
+        indicators[:, 1] = EMA.calculate(close_series, ema_slow).to_numpy(dtype=np.float64)
+        indicators[:, 2] = VWAP.calculate_from_arrays(high, low, close, volume)
+        indicators[:, 3] = ATR.calculate_from_arrays(high, low, close, atr_period)
+
+        return pd.DataFrame(indicators, index=df.index, columns=list(TREND_INDICATOR_COLUMNS))
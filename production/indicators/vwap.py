@@ -26,17 +26,49 @@ class VWAP:
         if len(df) == 0:
             return pd.Series(dtype=float)
 
+        high, low, close, volume = (
+            df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            for col in ('high', 'low', 'close', 'volume')
+        )
+
+        return pd.Series(VWAP.calculate_from_arrays(high, low, close, volume), index=df.index)
+
+    @staticmethod
+    def calculate_from_arrays(
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate intraday VWAP from raw float64 arrays
+
+        Same result as calculate(); missing values are skipped by the
+        cumulative sums and stay NaN at their own bar, as in pandas.
+
+        Args:
+            high: High prices
+            low: Low prices
+            close: Close prices
+            volume: Volumes
+
+        Returns:
+            Array with VWAP values
+        """
         # Calculate typical price
-        typical_price = (df['high'] + df['low'] + df['close']) / 3
+        typical_price = (high + low + close) / 3
+        tp_volume = typical_price * volume
 
         # Calculate VWAP
-        cumulative_tp_volume = (typical_price * df['volume']).cumsum()
-        cumulative_volume = df['volume'].cumsum()
+        cumulative_tp_volume = np.nancumsum(tp_volume)
+        cumulative_tp_volume[np.isnan(tp_volume)] = np.nan
+        cumulative_volume = np.nancumsum(volume)
+        cumulative_volume[np.isnan(volume)] = np.nan
 
         # Avoid division by zero
-        vwap = cumulative_tp_volume / cumulative_volume.replace(0, np.nan)
+        cumulative_volume[cumulative_volume == 0] = np.nan
 
-        return vwap
+        return cumulative_tp_volume / cumulative_volume
 
     @staticmethod
     def calculate_daily_reset(df: pd.DataFrame) -> pd.DataFrame:
@@ -51,13 +83,18 @@ class VWAP:
         """
         result = df.copy()
 
-        # Group by date and calculate VWAP for each day
-        result['date'] = result.index.date
-        result['vwap'] = result.groupby('date', group_keys=False).apply(
-            lambda x: VWAP.calculate(x)
-        )
+        # Same formula as calculate(), with the cumulative sums restarting
+        # each day: two grouped cumsums instead of a Python call per day
+        typical_price = (df['high'] + df['low'] + df['close']) / 3
+        tp_volume = typical_price * df['volume']
+
+        # Midnight-normalized timestamps group on int64 values rather than
+        # hashing a column of datetime.date objects
+        day_key = df.index.normalize()
+        cumulative_tp_volume = tp_volume.groupby(day_key).cumsum()
+        cumulative_volume = df['volume'].groupby(day_key).cumsum()
+        result['vwap'] = cumulative_tp_volume / cumulative_volume.replace(0, np.nan)
 
-        result = result.drop('date', axis=1)
         return result
 
     @staticmethod
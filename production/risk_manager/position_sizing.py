@@ -3,7 +3,7 @@ Position Sizing and Risk Management
 Manages position sizing, trade tracking, and risk controls
 """
 
-import pandas as pd
+import numpy as np
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import logging
@@ -46,16 +46,10 @@ class PositionSizer:
                 'error': 'Invalid stop-loss (zero risk per share)'
             }
 
-        quantity = int(risk_amount / risk_per_share)
-        position_value = quantity * entry_price
-
-        # Ensure position not too large (max 20% of capital)
+        # Risk-based quantity, capped so the position stays within 20% of capital
         max_position_value = capital * 0.2
-
-        if position_value > max_position_value:
-            quantity = int(max_position_value / entry_price)
-            position_value = quantity * entry_price
-            actual_risk = quantity * risk_per_share
+        quantity = min(int(risk_amount / risk_per_share), int(max_position_value / entry_price))
+        position_value = quantity * entry_price
 
         return {
             'quantity': quantity,
@@ -65,6 +59,104 @@ class PositionSizer:
             'risk_percent': risk_percent
         }
 
+    @staticmethod
+    def calculate_position_size_batch(
+        capital: float,
+        entry_prices: np.ndarray,
+        stop_losses: np.ndarray,
+        risk_percent: float = 1.0
+    ) -> Dict[str, np.ndarray]:
+        """
+        Vectorized calculate_position_size for many signals at once
+
+        Args:
+            capital: Total trading capital
+            entry_prices: Entry prices
+            stop_losses: Stop-loss prices
+            risk_percent: Percentage of capital to risk (default 1.0%)
+
+        Returns:
+            Dictionary of arrays: quantity, position_value, risk_per_share
+            (quantity is 0 where the stop-loss equals the entry)
+        """
+        entry_prices = np.asarray(entry_prices, dtype=np.float64)
+        risk_amount = capital * (risk_percent / 100)
+        risk_per_share = np.abs(entry_prices - np.asarray(stop_losses, dtype=np.float64))
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            quantity = np.where(
+                risk_per_share == 0, 0, np.trunc(risk_amount / risk_per_share)
+            ).astype(np.int64)
+
+            # Ensure position not too large (max 20% of capital)
+            max_position_value = capital * 0.2
+            max_quantity = np.trunc(max_position_value / entry_prices).astype(np.int64)
+
+        quantity = np.minimum(quantity, max_quantity)
+
+        return {
+            'quantity': quantity,
+            'position_value': quantity * entry_prices,
+            'risk_per_share': risk_per_share
+        }
+
+    @staticmethod
+    def validate_signals(
+        signals: List[Dict],
+        capital: float,
+        config: Dict
+    ) -> List[Tuple[bool, str, Optional[Dict]]]:
+        """
+        Validate many signals against the same capital in one batch
+
+        Equivalent to calling validate_signal for each signal.
+
+        Args:
+            signals: Trading signals
+            capital: Available capital
+            config: Risk configuration
+
+        Returns:
+            List of (is_valid, reason, position_info) tuples, one per signal
+        """
+        if not signals:
+            return []
+
+        risk_percent = config['risk']['risk_per_trade_percent']
+        risk_amount = capital * (risk_percent / 100)
+        entries = np.fromiter((s['entry'] for s in signals), dtype=np.float64, count=len(signals))
+        stops = np.fromiter((s['stop_loss'] for s in signals), dtype=np.float64, count=len(signals))
+        targets = np.fromiter((s['target'] for s in signals), dtype=np.float64, count=len(signals))
+
+        batch = PositionSizer.calculate_position_size_batch(capital, entries, stops, risk_percent)
+        potential_profit = batch['quantity'] * np.abs(targets - entries)
+
+        results = []
+        for i in range(len(signals)):
+            quantity = int(batch['quantity'][i])
+
+            if quantity == 0:
+                reason = 'Invalid stop-loss (zero risk per share)' if batch['risk_per_share'][i] == 0 else 'Invalid position size'
+                results.append((False, reason, None))
+                continue
+
+            position_value = float(batch['position_value'][i])
+            if position_value > capital:
+                results.append((False, 'Insufficient capital', None))
+                continue
+
+            results.append((True, 'Valid', {
+                'quantity': quantity,
+                'risk_amount': risk_amount,
+                'position_value': position_value,
+                'risk_per_share': float(batch['risk_per_share'][i]),
+                'risk_percent': risk_percent,
+                'potential_profit': float(potential_profit[i]),
+                'risk_reward': float(potential_profit[i]) / risk_amount if risk_amount > 0 else 0
+            }))
+
+        return results
+
     @staticmethod
     def validate_signal(
         signal: Dict,
@@ -128,10 +220,15 @@ class RiskManager:
 
         # Trade tracking
         self.trades = []
+        self._trades_by_id = {}  # id -> trade dict (same objects as self.trades)
+        # Trade ids by status; dicts used as insertion-ordered sets
+        self._open_ids = {}
+        self._closed_ids = {}
         self.daily_trades = 0
         self.consecutive_losses = 0
         self.winning_trades = 0
         self.losing_trades = 0
+        self._total_pnl = 0.0  # Running sum of closed-trade P&L
 
     def can_take_trade(self) -> Tuple[bool, str]:
         """
@@ -159,7 +256,7 @@ class RiskManager:
         symbol: str,
         signal: Dict,
         position: Dict,
-        timestamp: datetime = None
+        timestamp: datetime
     ) -> Dict:
         """
         Add a new trade
@@ -168,14 +265,11 @@ class RiskManager:
             symbol: Stock symbol
             signal: Trading signal
             position: Position sizing info
-            timestamp: Trade timestamp
+            timestamp: Trade timestamp (the caller's current tick/bar time)
 
         Returns:
             Trade dictionary
         """
-        if timestamp is None:
-            timestamp = datetime.now()
-
         trade = {
             'id': len(self.trades) + 1,
             'symbol': symbol,
@@ -193,11 +287,13 @@ class RiskManager:
         }
 
         self.trades.append(trade)
+        self._trades_by_id[trade['id']] = trade
+        self._open_ids[trade['id']] = None
         self.daily_trades += 1
 
         logger.info(
-            f"Trade #{trade['id']}: {signal['type']} {symbol} "
-            f"qty={position['quantity']} @ {signal['entry']:.2f}"
+            "Trade #%d: %s %s qty=%d @ %.2f",
+            trade['id'], signal['type'], symbol, position['quantity'], signal['entry']
         )
 
         return trade
@@ -206,7 +302,7 @@ class RiskManager:
         self,
         trade_id: int,
         exit_price: float,
-        timestamp: datetime = None
+        timestamp: datetime
     ) -> Dict:
         """
         Close an open trade
@@ -214,20 +310,13 @@ class RiskManager:
         Args:
             trade_id: Trade ID
             exit_price: Exit price
-            timestamp: Exit timestamp
+            timestamp: Exit timestamp (the caller's current tick/bar time)
 
         Returns:
             Updated trade dictionary
         """
-        if timestamp is None:
-            timestamp = datetime.now()
-
         # Find trade
-        trade = None
-        for t in self.trades:
-            if t['id'] == trade_id:
-                trade = t
-                break
+        trade = self._trades_by_id.get(trade_id)
 
         if not trade:
             return {'error': 'Trade not found'}
@@ -247,31 +336,34 @@ class RiskManager:
         trade['exit_price'] = exit_price
         trade['exit_time'] = timestamp
         trade['status'] = 'closed'
+        del self._open_ids[trade_id]
+        self._closed_ids[trade_id] = None
         trade['pnl'] = pnl
         trade['pnl_percent'] = pnl_percent
 
         # Update capital
         self.capital += pnl
+        self._total_pnl += pnl
 
         # Track win/loss
         if pnl > 0:
             self.winning_trades += 1
             self.consecutive_losses = 0
-            logger.info(f"Trade #{trade_id} CLOSED: WIN +₹{pnl:.2f} ({pnl_percent:+.2f}%)")
+            logger.info("Trade #%d CLOSED: WIN +₹%.2f (%+.2f%%)", trade_id, pnl, pnl_percent)
         else:
             self.losing_trades += 1
             self.consecutive_losses += 1
-            logger.info(f"Trade #{trade_id} CLOSED: LOSS ₹{pnl:.2f} ({pnl_percent:+.2f}%)")
+            logger.info("Trade #%d CLOSED: LOSS ₹%.2f (%+.2f%%)", trade_id, pnl, pnl_percent)
 
         return trade
 
     def get_open_trades(self) -> List[Dict]:
-        """Get all open trades"""
-        return [t for t in self.trades if t['status'] == 'open']
+        """Get all open trades (in the order they were opened)"""
+        return [self._trades_by_id[i] for i in self._open_ids]
 
     def get_closed_trades(self) -> List[Dict]:
-        """Get all closed trades"""
-        return [t for t in self.trades if t['status'] == 'closed']
+        """Get all closed trades (in the order they were closed)"""
+        return [self._trades_by_id[i] for i in self._closed_ids]
 
     def get_summary(self) -> Dict:
         """
@@ -280,9 +372,9 @@ class RiskManager:
         Returns:
             Dictionary with summary metrics
         """
-        closed_trades = self.get_closed_trades()
+        n_closed = len(self._closed_ids)
 
-        if not closed_trades:
+        if not n_closed:
             return {
                 'total_trades': 0,
                 'winning_trades': 0,
@@ -296,17 +388,17 @@ class RiskManager:
                 'capital_change_percent': 0
             }
 
-        total_pnl = sum(t['pnl'] for t in closed_trades)
+        total_pnl = self._total_pnl
         total_pnl_percent = ((self.capital - self.initial_capital) / self.initial_capital) * 100
 
         return {
-            'total_trades': len(closed_trades),
+            'total_trades': n_closed,
             'winning_trades': self.winning_trades,
             'losing_trades': self.losing_trades,
-            'win_rate': (self.winning_trades / len(closed_trades)) * 100 if closed_trades else 0,
+            'win_rate': (self.winning_trades / n_closed) * 100,
             'total_pnl': total_pnl,
             'total_pnl_percent': total_pnl_percent,
-            'average_pnl': total_pnl / len(closed_trades) if closed_trades else 0,
+            'average_pnl': total_pnl / n_closed,
             'current_capital': self.capital,
             'capital_change': self.capital - self.initial_capital,
             'capital_change_percent': total_pnl_percent,
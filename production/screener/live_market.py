@@ -5,15 +5,97 @@ Refines candidates after market open (9:20 AM onwards)
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
-from ..data_ingest import CSVDataLoader
-from ..indicators import EMA, VWAP, ATR
+from ..data_ingest import CSVDataLoader, CSVSourceConfig
 
 logger = logging.getLogger(__name__)
 
+FIXED_LEVEL_NAMES = ('Yesterday High', 'Yesterday Low', 'Opening Range High', 'Opening Range Low')
+
+
+def _nearest_key_level(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    current_price: float,
+    fixed_levels: Tuple[float, float, float, float],
+    proximity_pct: float
+) -> Optional[Tuple[str, float, float]]:
+    """
+    Find the closest key level within proximity of the current price
+
+    Key levels are the fixed levels (yesterday high/low, opening range
+    high/low) plus the last 3 swing highs and last 3 swing lows.
+
+    Args:
+        highs: Intraday highs
+        lows: Intraday lows
+        current_price: Current price
+        fixed_levels: Levels named by FIXED_LEVEL_NAMES, in that order
+        proximity_pct: Maximum distance from price (%)
+
+    Returns:
+        Tuple of (level_name, level_price, distance_pct) or None
+    """
+    # Swing points (supply/demand zones): bars beyond both neighbours on
+    # each side, compared as shifted views
+    swing_highs = highs[:0]
+    swing_lows = lows[:0]
+
+    if len(highs) >= 5:
+        mid_h = highs[2:-2]
+        mid_l = lows[2:-2]
+
+        is_swing_high = (
+            (mid_h > highs[1:-3]) & (mid_h > highs[:-4]) &
+            (mid_h > highs[3:-1]) & (mid_h > highs[4:])
+        )
+        is_swing_low = (
+            (mid_l < lows[1:-3]) & (mid_l < lows[:-4]) &
+            (mid_l < lows[3:-1]) & (mid_l < lows[4:])
+        )
+
+        swing_highs = mid_h[is_swing_high][-3:]  # Last 3 swing highs
+        swing_lows = mid_l[is_swing_low][-3:]    # Last 3 swing lows
+
+    levels = np.concatenate((fixed_levels, swing_highs, swing_lows))
+    names = (
+        FIXED_LEVEL_NAMES
+        + ('Swing High',) * len(swing_highs)
+        + ('Swing Low',) * len(swing_lows)
+    )
+
+    # Sort the levels once (stable, NaN last) and binary search for the
+    # price: the nearest level is one of its two neighbours
+    order = np.argsort(levels, kind='stable')
+    sorted_levels = levels[order][:np.count_nonzero(~np.isnan(levels))]
+    i = int(np.searchsorted(sorted_levels, current_price))
+
+    # Neighbour positions; each is moved to the start of its run of equal
+    # levels, which holds the first such level in the original order
+    neighbours = []
+    if i > 0:
+        neighbours.append(int(np.searchsorted(sorted_levels, sorted_levels[i - 1])))
+    if i < len(sorted_levels):
+        neighbours.append(i)
+
+    best = None
+    for position in neighbours:
+        level_index = int(order[position])
+        distance = abs((current_price - levels[level_index]) / current_price) * 100
+        # Ties go to the level listed first, as with a linear scan
+        if best is None or (distance, level_index) < best:
+            best = (distance, level_index)
+
+    if best is None or not best[0] <= proximity_pct:
+        return None
+
+    distance, level_index = best
+    return names[level_index], levels[level_index], distance
+
 
 class LiveMarketFilter:
     """
@@ -21,19 +103,17 @@ class LiveMarketFilter:
     Uses 5-minute candles for analysis
     """
 
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, data_loader: Optional[CSVDataLoader] = None):
         """
         Initialize live market filter
 
         Args:
             config: Configuration dictionary from YAML
+            data_loader: Optional loader to share (and share its in-memory
+                cache) with other stages; built from config when omitted
         """
         self.config = config
-        self.data_loader = CSVDataLoader(
-            minute_data_dir=config['data']['csv']['minute_data_dir'],
-            daily_data_dir=config['data']['csv']['daily_data_dir'],
-            timezone=config['market']['timezone']
-        )
+        self.data_loader = data_loader or CSVDataLoader.from_source(CSVSourceConfig.from_config(config))
 
     def apply_trend_filter(
         self,
@@ -53,6 +133,10 @@ class LiveMarketFilter:
         Returns:
             List of stocks with clear trend
         """
+        # Imported where used: the trend filter is the only stage here
+        # that needs the indicators
+        from ..indicators import TrendIndicators
+
         logger.info("Applying trend filter (5-min chart)...")
 
         ema_slow_period = self.config['live_market']['ema_slow']
@@ -72,22 +156,21 @@ class LiveMarketFilter:
                 )
 
                 if data.empty or len(data) < ema_slow_period:
-                    logger.debug(f"{symbol}: Insufficient data")
+                    logger.debug("%s: Insufficient data", symbol)
                     continue
 
-                # Calculate indicators
-                data['ema_20'] = EMA.calculate(data['close'], ema_fast_period)
-                data['ema_200'] = EMA.calculate(data['close'], ema_slow_period)
-                data['vwap'] = VWAP.calculate(data)
-                data['atr'] = ATR.calculate(data, period=14)
+                # Calculate indicators from one shared set of arrays and
+                # attach them with one concat (the signal engine reads these
+                # columns) instead of four inserts
+                indicators = TrendIndicators.calculate(
+                    data, ema_fast_period, ema_slow_period, atr_period=14
+                )
+                data = pd.concat([data, indicators], axis=1)
 
-                # Get latest values
-                latest = data.iloc[-1]
-                current_price = latest['close']
-                ema_20 = latest['ema_20']
-                ema_200 = latest['ema_200']
-                vwap = latest['vwap']
-                atr = latest['atr']
+                # Get latest values straight from the arrays
+                close = data['close'].to_numpy()
+                current_price = close[-1]
+                ema_20, ema_200, vwap, atr = indicators.to_numpy()[-1]
 
                 # Check for NaN
                 if pd.isna(ema_200) or pd.isna(vwap):
@@ -113,19 +196,28 @@ class LiveMarketFilter:
                     candidate['ema_200'] = ema_200
                     candidate['vwap'] = vwap
                     candidate['atr'] = atr
-                    candidate['data'] = data  # Store for later analysis
+                    # Kept only for the signal engine, which reads the
+                    # indicator columns; the live filters below use the arrays
+                    candidate['data'] = data
+                    candidate['_high'] = data['high'].to_numpy()
+                    candidate['_low'] = data['low'].to_numpy()
+                    candidate['_close'] = close
+                    candidate['_volume'] = data['volume'].to_numpy()
+                    # Session extremes, reused by the range and location filters
+                    candidate['today_high'] = candidate['_high'].max()
+                    candidate['today_low'] = candidate['_low'].min()
                     trend_stocks.append(candidate)
 
                     logger.debug(
-                        f"{symbol}: {trend}, price={current_price:.2f}, "
-                        f"ema200={ema_200:.2f}, vwap={vwap:.2f}"
+                        "%s: %s, price=%.2f, ema200=%.2f, vwap=%.2f",
+                        symbol, trend, current_price, ema_200, vwap
                     )
 
             except Exception as e:
-                logger.error(f"Error processing {symbol} in trend filter: {e}")
+                logger.error("Error processing %s in trend filter: %s", symbol, e)
                 continue
 
-        logger.info(f"Found {len(trend_stocks)} stocks with clear trend")
+        logger.info("Found %d stocks with clear trend", len(trend_stocks))
         return trend_stocks
 
     def apply_volume_range_filter(self, stocks: List[Dict]) -> List[Dict]:
@@ -150,22 +242,25 @@ class LiveMarketFilter:
 
         filtered_stocks = []
 
-        for stock in stocks:
+        # Volume surge for every stock at once: the trailing lookback+1
+        # volumes of each long enough series are stacked into one matrix.
+        # Shorter series keep a neutral ratio of 1.0
+        volume_ratios = np.ones(len(stocks))
+        eligible = [i for i, stock in enumerate(stocks) if len(stock['_volume']) >= lookback + 1]
+        if eligible:
+            window = np.stack([stocks[i]['_volume'][-lookback-1:] for i in eligible])
+            current_volume = window[:, -1]
+            avg_volume = window[:, :-1].mean(axis=1)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                volume_ratios[eligible] = np.where(avg_volume > 0, current_volume / avg_volume, 0.0)
+
+        for stock, volume_ratio in zip(stocks, volume_ratios):
             symbol = stock['symbol']
-            data = stock['data']
 
             try:
-                # Check volume surge
-                if len(data) >= lookback + 1:
-                    current_volume = data['volume'].iloc[-1]
-                    avg_volume = data['volume'].iloc[-lookback-1:-1].mean()
-                    volume_ratio = current_volume / avg_volume if avg_volume > 0 else 0
-                else:
-                    volume_ratio = 1.0
-
                 # Calculate today's range
-                today_high = data['high'].max()
-                today_low = data['low'].min()
+                today_high = stock['today_high']
+                today_low = stock['today_low']
                 current_price = stock['current_price_live']
                 today_range_pct = ((today_high - today_low) / current_price) * 100
 
@@ -173,20 +268,18 @@ class LiveMarketFilter:
                 if volume_ratio >= min_volume_ratio and today_range_pct >= min_range_pct:
                     stock['volume_ratio'] = volume_ratio
                     stock['today_range_pct'] = today_range_pct
-                    stock['today_high'] = today_high
-                    stock['today_low'] = today_low
                     filtered_stocks.append(stock)
 
                     logger.debug(
-                        f"{symbol}: vol_ratio={volume_ratio:.2f}x, "
-                        f"range={today_range_pct:.2f}%"
+                        "%s: vol_ratio=%.2fx, range=%.2f%%",
+                        symbol, volume_ratio, today_range_pct
                     )
 
             except Exception as e:
-                logger.error(f"Error processing {symbol} in volume/range filter: {e}")
+                logger.error("Error processing %s in volume/range filter: %s", symbol, e)
                 continue
 
-        logger.info(f"Found {len(filtered_stocks)} stocks with good volume & range")
+        logger.info("Found %d stocks with good volume & range", len(filtered_stocks))
         return filtered_stocks
 
     def apply_location_filter(self, stocks: List[Dict]) -> List[Dict]:
@@ -210,24 +303,32 @@ class LiveMarketFilter:
 
         location_stocks = []
 
+        # Prefetch daily data for every stock up front; the reads are file
+        # I/O, so they overlap on a thread pool instead of running per stock
+        symbols = [stock['symbol'] for stock in stocks]
+        with ThreadPoolExecutor(max_workers=min(8, len(symbols) or 1)) as executor:
+            daily_by_symbol = dict(zip(symbols, executor.map(
+                lambda symbol: self.data_loader.load_daily_data(symbol, lookback_days=5),
+                symbols
+            )))
+
         for stock in stocks:
             symbol = stock['symbol']
             current_price = stock['current_price_live']
-            data = stock['data']
+            highs = stock['_high']
+            lows = stock['_low']
 
             try:
                 # Get opening range (first 3 candles of 5-min data = 15 min)
-                if len(data) >= 3:
-                    opening_range_data = data.iloc[:3]
-                    opening_range_high = opening_range_data['high'].max()
-                    opening_range_low = opening_range_data['low'].min()
+                if len(highs) >= 3:
+                    opening_range_high = highs[:3].max()
+                    opening_range_low = lows[:3].min()
                 else:
-                    opening_range_high = data['high'].max()
-                    opening_range_low = data['low'].min()
+                    opening_range_high = stock['today_high']
+                    opening_range_low = stock['today_low']
 
-                # Get yesterday's high/low from gap info (already loaded)
-                # We can also load it fresh if needed
-                daily_data = self.data_loader.load_daily_data(symbol, lookback_days=5)
+                # Get yesterday's high/low from the prefetched daily data
+                daily_data = daily_by_symbol[symbol]
                 if len(daily_data) >= 2:
                     yesterday_high = daily_data['high'].iloc[-2]
                     yesterday_low = daily_data['low'].iloc[-2]
@@ -235,49 +336,13 @@ class LiveMarketFilter:
                     yesterday_high = current_price * 1.02
                     yesterday_low = current_price * 0.98
 
-                # Find recent swing highs/lows (supply/demand zones)
-                swing_highs = []
-                swing_lows = []
-
-                if len(data) >= 5:
-                    for i in range(2, len(data) - 2):
-                        # Swing high
-                        if data['high'].iloc[i] > data['high'].iloc[i-1] and \
-                           data['high'].iloc[i] > data['high'].iloc[i-2] and \
-                           data['high'].iloc[i] > data['high'].iloc[i+1] and \
-                           data['high'].iloc[i] > data['high'].iloc[i+2]:
-                            swing_highs.append(data['high'].iloc[i])
-
-                        # Swing low
-                        if data['low'].iloc[i] < data['low'].iloc[i-1] and \
-                           data['low'].iloc[i] < data['low'].iloc[i-2] and \
-                           data['low'].iloc[i] < data['low'].iloc[i+1] and \
-                           data['low'].iloc[i] < data['low'].iloc[i+2]:
-                            swing_lows.append(data['low'].iloc[i])
-
-                # Collect all key levels
-                key_levels = []
-                key_levels.append(('Yesterday High', yesterday_high))
-                key_levels.append(('Yesterday Low', yesterday_low))
-                key_levels.append(('Opening Range High', opening_range_high))
-                key_levels.append(('Opening Range Low', opening_range_low))
-
-                for swing_high in swing_highs[-3:]:  # Last 3 swing highs
-                    key_levels.append(('Swing High', swing_high))
-
-                for swing_low in swing_lows[-3:]:  # Last 3 swing lows
-                    key_levels.append(('Swing Low', swing_low))
-
-                # Check proximity to any key level
-                near_level = None
-                min_distance = float('inf')
-
-                for level_name, level_price in key_levels:
-                    distance_pct = abs((current_price - level_price) / current_price) * 100
-
-                    if distance_pct <= proximity_pct and distance_pct < min_distance:
-                        min_distance = distance_pct
-                        near_level = (level_name, level_price, distance_pct)
+                near_level = _nearest_key_level(
+                    highs,
+                    lows,
+                    current_price,
+                    (yesterday_high, yesterday_low, opening_range_high, opening_range_low),
+                    proximity_pct
+                )
 
                 # Add location info
                 stock['opening_range_high'] = opening_range_high
@@ -297,10 +362,10 @@ class LiveMarketFilter:
                 location_stocks.append(stock)
 
             except Exception as e:
-                logger.error(f"Error processing {symbol} in location filter: {e}")
+                logger.error("Error processing %s in location filter: %s", symbol, e)
                 continue
 
-        logger.info(f"Processed {len(location_stocks)} stocks for location")
+        logger.info("Processed %d stocks for location", len(location_stocks))
         return location_stocks
 
     def run_filtering(
@@ -318,7 +383,7 @@ class LiveMarketFilter:
         Returns:
             Final 3-4 stocks for trading
         """
-        logger.info(f"Running live market filtering for {date.date()}")
+        logger.info("Running live market filtering for %s", date.date())
 
         if not candidates:
             logger.warning("No candidates to filter")
@@ -341,16 +406,20 @@ class LiveMarketFilter:
         # Step 3: Location filter
         final_stocks = self.apply_location_filter(volume_range_stocks)
 
-        # Sort by trend strength and volume
-        final_stocks.sort(
-            key=lambda x: (x['trend_strength'], x['volume_ratio']),
-            reverse=True
+        # Sort by trend strength and volume, descending. lexsort is stable,
+        # so ties keep their filter order just like list.sort(reverse=True)
+        keys = np.fromiter(
+            ((s['trend_strength'], s['volume_ratio']) for s in final_stocks),
+            dtype=[('t', 'f8'), ('v', 'f8')],
+            count=len(final_stocks)
         )
+        order = np.lexsort((-keys['v'], -keys['t']))
+        final_stocks = [final_stocks[i] for i in order]
 
         # Select top candidates
         max_final = self.config['live_market']['max_candidates']
         final_candidates = final_stocks[:max_final]
 
-        logger.info(f"Selected {len(final_candidates)} final candidates")
+        logger.info("Selected %d final candidates", len(final_candidates))
 
         return final_candidates
@@ -0,0 +1,83 @@
+"""
+Signal Kernels
+Scalar hot paths of the signal engine, JIT-compiled when numba is installed
+"""
+
+# numba's nopython JIT when available, else the plain Python functions
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def score_signal_kernel(
+    entry: float,
+    ema_200: float,
+    volume_ratio: float,
+    reversal_strength: float,
+    risk: float,
+    reward: float
+) -> float:
+    """
+    Score signal quality (0-100), see SignalGenerator.score_signal
+
+    Args:
+        entry: Entry price
+        ema_200: 200 EMA at entry
+        volume_ratio: Current to average volume ratio
+        reversal_strength: Reversal pattern strength (0-1)
+        risk: Absolute entry to stop-loss distance
+        reward: Absolute entry to target distance
+
+    Returns:
+        Quality score (0-100)
+    """
+    score = 0.0
+
+    # Trend strength (30 points)
+    distance_from_200 = abs((entry - ema_200) / ema_200) * 100
+
+    if distance_from_200 > 2:
+        score += 30
+    elif distance_from_200 > 1:
+        score += 20
+    else:
+        score += 10
+
+    # Volume surge (25 points)
+    if volume_ratio > 2:
+        score += 25
+    elif volume_ratio > 1.5:
+        score += 20
+    elif volume_ratio > 1.2:
+        score += 15
+    else:
+        score += 10
+
+    # Reversal pattern strength (25 points)
+    score += reversal_strength * 25
+
+    # Risk-reward (20 points)
+    rr_ratio = reward / risk if risk > 0 else 0.0
+
+    if rr_ratio >= 2:
+        score += 20
+    elif rr_ratio >= 1.5:
+        score += 15
+    else:
+        score += 10
+
+    return min(score, 100.0)
+
+
+# Compile the kernel up front so the first signal does not pay for it
+if NUMBA_AVAILABLE:
+    score_signal_kernel(1.0, 1.0, 1.0, 0.0, 1.0, 1.0)
@@ -5,13 +5,103 @@ Generates BUY/SELL signals based on 20/200 EMA + VWAP method
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 
 from ..indicators import EMA, VWAP, ATR
+from ._kernels import score_signal_kernel
 
 logger = logging.getLogger(__name__)
 
+# Reversal patterns by code (0 = no pattern) and their strengths
+PATTERN_NAMES = ('none', 'hammer', 'engulfing', 'bullish_candle', 'shooting_star', 'bearish_candle')
+PATTERN_STRENGTHS = np.array([0.0, 0.8, 0.9, 0.6, 0.8, 0.6])
+
+# Trade direction sign -> (config section, signal type, stop-loss direction)
+SIGNAL_SIDES = {1: ('buy', 'BUY', 'long'), -1: ('sell', 'SELL', 'short')}
+
+# Candidate trend (from the live trend filter) -> trade direction sign
+TREND_SIGNS = {'bullish': 1, 'bearish': -1}
+
+# Indicator columns the detectors need on each candidate's data
+SIGNAL_INDICATOR_COLUMNS = ('ema_20', 'ema_200', 'vwap', 'atr')
+
+# Candles checked for a touch of the 20 EMA when price has moved away
+PULLBACK_LOOKBACK = 3
+
+# Candles averaged for the volume ratio (excluding the latest), and the
+# trailing window every detector condition fits in
+VOLUME_LOOKBACK = 10
+SIGNAL_WINDOW = VOLUME_LOOKBACK + 1
+
+# Fewest candles a candidate needs before any signal is considered
+MIN_SIGNAL_CANDLES = 5
+
+
+def _touched_level(low: np.ndarray, high: np.ndarray, level: np.ndarray, lookback: int) -> np.ndarray:
+    """
+    Check whether any of the last lookback candles traded through a level
+
+    Works on one series or on rows of stacked series (time on the last axis).
+
+    Args:
+        low: Candle lows
+        high: Candle highs
+        level: Level per candle (e.g. the 20 EMA), aligned with low/high
+        lookback: Number of trailing candles to test
+
+    Returns:
+        True (per row) if low <= level <= high for any of those candles
+    """
+    recent = level[..., -lookback:]
+    return np.any((low[..., -lookback:] <= recent) & (recent <= high[..., -lookback:]), axis=-1)
+
+
+def _stack_tails(arrays: List[Tuple[np.ndarray, ...]], window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stack the trailing window of every candidate's arrays into one block
+
+    Args:
+        arrays: Per candidate, a tuple of equal-length arrays (see _precompute)
+        window: Number of trailing candles to keep
+
+    Returns:
+        Tuple of (block shaped candidates x arrays x window, with shorter
+        series NaN-padded on the left; series lengths)
+    """
+    n_fields = len(arrays[0]) if arrays else 0
+    block = np.full((len(arrays), n_fields, window), np.nan)
+    lengths = np.empty(len(arrays), dtype=np.intp)
+
+    for i, fields in enumerate(arrays):
+        length = len(fields[0])
+        lengths[i] = length
+        tail = min(length, window)
+        if tail:
+            block[i, :, window - tail:] = [values[-tail:] for values in fields]
+
+    return block, lengths
+
+
+def _precompute(data: pd.DataFrame) -> Optional[Tuple[np.ndarray, ...]]:
+    """
+    Extract the arrays the signal detectors read, once per candidate
+
+    Args:
+        data: DataFrame with OHLCV data and the trend filter's indicators
+
+    Returns:
+        Tuple of (open, high, low, close, volume, ema_20, ema_200, vwap, atr)
+        arrays, or None if any indicator column is missing
+    """
+    if not all(col in data.columns for col in SIGNAL_INDICATOR_COLUMNS):
+        return None
+
+    return tuple(
+        data[col].to_numpy()
+        for col in ('open', 'high', 'low', 'close', 'volume') + SIGNAL_INDICATOR_COLUMNS
+    )
+
 
 class SignalGenerator:
     """
@@ -39,6 +129,97 @@ class SignalGenerator:
         """
         self.config = config
 
+    @staticmethod
+    def classify_patterns(
+        data: pd.DataFrame,
+        signal_type: str = 'buy'
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Classify the reversal pattern of every candle in one vectorized pass
+
+        Args:
+            data: DataFrame with OHLCV data
+            signal_type: 'buy' or 'sell'
+
+        Returns:
+            Tuple of (pattern codes indexing PATTERN_NAMES, pattern strengths)
+        """
+        return SignalGenerator.classify_patterns_from_arrays(
+            *(
+                data[col].to_numpy(dtype=np.float64, na_value=np.nan)
+                for col in ('open', 'high', 'low', 'close')
+            ),
+            signal_type=signal_type
+        )
+
+    @staticmethod
+    def classify_patterns_from_arrays(
+        open_price: np.ndarray,
+        high_price: np.ndarray,
+        low_price: np.ndarray,
+        close_price: np.ndarray,
+        signal_type: str = 'buy'
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        classify_patterns on plain OHLC arrays
+
+        Args:
+            open_price: Open prices
+            high_price: High prices
+            low_price: Low prices
+            close_price: Close prices
+            signal_type: 'buy' or 'sell'
+
+        Returns:
+            Tuple of (pattern codes indexing PATTERN_NAMES, pattern strengths)
+        """
+        open_price, high_price, low_price, close_price = (
+            np.asarray(values, dtype=np.float64)
+            for values in (open_price, high_price, low_price, close_price)
+        )
+
+        # Previous candle, shifted by one bar (NaN before the first)
+        prev_open = np.empty_like(open_price)
+        prev_close = np.empty_like(close_price)
+        prev_open[:1] = np.nan
+        prev_close[:1] = np.nan
+        prev_open[1:] = open_price[:-1]
+        prev_close[1:] = close_price[:-1]
+
+        body = np.abs(close_price - open_price)
+        upper_wick = high_price - np.maximum(open_price, close_price)
+        lower_wick = np.minimum(open_price, close_price) - low_price
+        total_range = high_price - low_price
+
+        if signal_type == 'buy':
+            rising = close_price > open_price
+            patterns = [
+                # Bullish Hammer
+                (lower_wick > 2 * body) & (upper_wick < body * 0.5) & rising,
+                # Bullish Engulfing
+                rising & (prev_close < prev_open) & (close_price > prev_open) & (open_price < prev_close),
+                # Bullish candle
+                rising & (body > total_range * 0.6),
+            ]
+            pattern_codes = [1, 2, 3]
+        else:  # sell
+            falling = close_price < open_price
+            patterns = [
+                # Bearish Shooting Star
+                (upper_wick > 2 * body) & (lower_wick < body * 0.5) & falling,
+                # Bearish Engulfing
+                falling & (prev_close > prev_open) & (close_price < prev_open) & (open_price > prev_close),
+                # Bearish candle
+                falling & (body > total_range * 0.6),
+            ]
+            pattern_codes = [4, 2, 5]
+
+        # First matching pattern wins; flat candles never match
+        codes = np.select(patterns, pattern_codes, default=0).astype(np.int8)
+        codes[total_range == 0] = 0
+
+        return codes, PATTERN_STRENGTHS[codes]
+
     def detect_reversal_candle(
         self,
         data: pd.DataFrame,
@@ -65,55 +246,30 @@ class SignalGenerator:
         if len(data) < abs(index) + 2:
             return {'type': 'none', 'strength': 0, 'pattern': 'none'}
 
-        current = data.iloc[index]
-        previous = data.iloc[index - 1]
-
-        open_price = current['open']
-        close_price = current['close']
-        high_price = current['high']
-        low_price = current['low']
-
-        body = abs(close_price - open_price)
-        upper_wick = high_price - max(open_price, close_price)
-        lower_wick = min(open_price, close_price) - low_price
-        total_range = high_price - low_price
+        codes, strengths = self.classify_patterns(data, signal_type)
+        code = codes[index]
 
-        if total_range == 0:
+        if code == 0:
             return {'type': 'none', 'strength': 0, 'pattern': 'none'}
 
-        result = {'type': 'none', 'strength': 0, 'pattern': 'none'}
-
-        if signal_type == 'buy':
-            # Bullish Hammer
-            if lower_wick > 2 * body and upper_wick < body * 0.5 and close_price > open_price:
-                result = {'type': 'bullish', 'strength': 0.8, 'pattern': 'hammer'}
-
-            # Bullish Engulfing
-            elif close_price > open_price and previous['close'] < previous['open'] and \
-                 close_price > previous['open'] and open_price < previous['close']:
-                result = {'type': 'bullish', 'strength': 0.9, 'pattern': 'engulfing'}
-
-            # Bullish candle
-            elif close_price > open_price and body > total_range * 0.6:
-                result = {'type': 'bullish', 'strength': 0.6, 'pattern': 'bullish_candle'}
-
-        else:  # sell
-            # Bearish Shooting Star
-            if upper_wick > 2 * body and lower_wick < body * 0.5 and close_price < open_price:
-                result = {'type': 'bearish', 'strength': 0.8, 'pattern': 'shooting_star'}
-
-            # Bearish Engulfing
-            elif close_price < open_price and previous['close'] > previous['open'] and \
-                 close_price < previous['open'] and open_price > previous['close']:
-                result = {'type': 'bearish', 'strength': 0.9, 'pattern': 'engulfing'}
-
-            # Bearish candle
-            elif close_price < open_price and body > total_range * 0.6:
-                result = {'type': 'bearish', 'strength': 0.6, 'pattern': 'bearish_candle'}
-
-        return result
+        return {
+            'type': 'bullish' if signal_type == 'buy' else 'bearish',
+            'strength': float(strengths[index]),
+            'pattern': PATTERN_NAMES[code]
+        }
 
-    def detect_buy_signal(self, data: pd.DataFrame) -> Optional[Dict]:
+    def detect_buy_signal(
+        self,
+        open_price: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+        ema_20_values: np.ndarray,
+        ema_200_values: np.ndarray,
+        vwap_values: np.ndarray,
+        atr_values: np.ndarray
+    ) -> Optional[Dict]:
         """
         Detect BUY signal
 
@@ -125,98 +281,30 @@ class SignalGenerator:
         5. Higher volume
 
         Args:
-            data: DataFrame with OHLCV and indicators
+            open_price, high, low, close, volume: OHLCV arrays
+            ema_20_values, ema_200_values, vwap_values, atr_values:
+                Indicator arrays aligned with the OHLCV arrays
 
         Returns:
             Signal dictionary or None
         """
-        if len(data) < 5:
-            return None
-
-        # Ensure indicators are present
-        required_cols = ['ema_20', 'ema_200', 'vwap', 'atr']
-        if not all(col in data.columns for col in required_cols):
-            return None
-
-        latest = data.iloc[-1]
-        current_price = latest['close']
-        ema_20 = latest['ema_20']
-        ema_200 = latest['ema_200']
-        vwap = latest['vwap']
-        atr = latest['atr']
-
-        # Check for NaN
-        if pd.isna(ema_20) or pd.isna(ema_200) or pd.isna(vwap):
-            return None
-
-        # Condition 1: Price > 200 EMA
-        if current_price <= ema_200:
-            return None
-
-        # Condition 2: Price > VWAP
-        if current_price <= vwap:
-            return None
-
-        # Condition 3: Pullback to 20 EMA
-        pullback_pct = self.config['signals']['buy']['pullback_to_20ema_percent']
-        distance_from_ema20 = abs((current_price - ema_20) / current_price) * 100
-
-        if distance_from_ema20 > pullback_pct:
-            # Check if touched in last 3 candles
-            touched_ema = False
-            for i in range(-3, 0):
-                if i >= -len(data):
-                    candle = data.iloc[i]
-                    if candle['low'] <= candle['ema_20'] <= candle['high']:
-                        touched_ema = True
-                        break
-
-            if not touched_ema:
-                return None
-
-        # Condition 4: Bullish reversal candle
-        reversal = self.detect_reversal_candle(data, index=-1, signal_type='buy')
-
-        if reversal['type'] != 'bullish':
-            return None
-
-        # Condition 5: Higher volume
-        min_volume_ratio = self.config['signals']['buy']['min_volume_ratio']
-
-        if len(data) >= 11:
-            current_volume = data['volume'].iloc[-1]
-            avg_volume = data['volume'].iloc[-11:-1].mean()
-            volume_ratio = current_volume / avg_volume if avg_volume > 0 else 0
-        else:
-            volume_ratio = 1.0
-
-        if volume_ratio < min_volume_ratio:
-            return None
-
-        # All conditions met - generate BUY signal
-        stop_loss = ATR.calculate_stop_loss(current_price, atr, multiplier=1.5, direction='long')
-        risk = current_price - stop_loss
-        target = current_price + (risk * self.config['risk']['target']['risk_reward_ratio'])
-
-        signal = {
-            'type': 'BUY',
-            'entry': current_price,
-            'stop_loss': stop_loss,
-            'target': round(target, 2),
-            'atr': atr,
-            'volume_ratio': volume_ratio,
-            'reversal_pattern': reversal['pattern'],
-            'reversal_strength': reversal['strength'],
-            'indicators': {
-                'ema_20': ema_20,
-                'ema_200': ema_200,
-                'vwap': vwap
-            }
-        }
-
-        return signal
+        return self.detect_signals(np.array([1]), [(
+            open_price, high, low, close, volume,
+            ema_20_values, ema_200_values, vwap_values, atr_values
+        )])[0]
 
-    def detect_sell_signal(self, data: pd.DataFrame) -> Optional[Dict]:
+    def detect_sell_signal(
+        self,
+        open_price: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+        ema_20_values: np.ndarray,
+        ema_200_values: np.ndarray,
+        vwap_values: np.ndarray,
+        atr_values: np.ndarray
+    ) -> Optional[Dict]:
         """
         Detect SELL signal
 
@@ -228,96 +316,129 @@ class SignalGenerator:
         5. Higher volume
 
         Args:
-            data: DataFrame with OHLCV and indicators
+            open_price, high, low, close, volume: OHLCV arrays
+            ema_20_values, ema_200_values, vwap_values, atr_values:
+                Indicator arrays aligned with the OHLCV arrays
 
         Returns:
             Signal dictionary or None
         """
-        if len(data) < 5:
-            return None
-
-        # Ensure indicators are present
-        required_cols = ['ema_20', 'ema_200', 'vwap', 'atr']
-        if not all(col in data.columns for col in required_cols):
-            return None
-
-        latest = data.iloc[-1]
-        current_price = latest['close']
-        ema_20 = latest['ema_20']
-        ema_200 = latest['ema_200']
-        vwap = latest['vwap']
-        atr = latest['atr']
-
-        # Check for NaN
-        if pd.isna(ema_20) or pd.isna(ema_200) or pd.isna(vwap):
-            return None
-
-        # Condition 1: Price < 200 EMA
-        if current_price >= ema_200:
-            return None
-
-        # Condition 2: Price < VWAP
-        if current_price >= vwap:
-            return None
-
-        # Condition 3: Pullback to 20 EMA
-        pullback_pct = self.config['signals']['sell']['pullback_to_20ema_percent']
-        distance_from_ema20 = abs((current_price - ema_20) / current_price) * 100
-
-        if distance_from_ema20 > pullback_pct:
-            # Check if touched in last 3 candles
-            touched_ema = False
-            for i in range(-3, 0):
-                if i >= -len(data):
-                    candle = data.iloc[i]
-                    if candle['low'] <= candle['ema_20'] <= candle['high']:
-                        touched_ema = True
-                        break
-
-            if not touched_ema:
-                return None
-
-        # Condition 4: Bearish reversal candle
-        reversal = self.detect_reversal_candle(data, index=-1, signal_type='sell')
-
-        if reversal['type'] != 'bearish':
-            return None
-
-        # Condition 5: Higher volume
-        min_volume_ratio = self.config['signals']['sell']['min_volume_ratio']
-
-        if len(data) >= 11:
-            current_volume = data['volume'].iloc[-1]
-            avg_volume = data['volume'].iloc[-11:-1].mean()
-            volume_ratio = current_volume / avg_volume if avg_volume > 0 else 0
-        else:
-            volume_ratio = 1.0
-
-        if volume_ratio < min_volume_ratio:
-            return None
-
-        # All conditions met - generate SELL signal
-        stop_loss = ATR.calculate_stop_loss(current_price, atr, multiplier=1.5, direction='short')
-        risk = stop_loss - current_price
-        target = current_price - (risk * self.config['risk']['target']['risk_reward_ratio'])
-
-        signal = {
-            'type': 'SELL',
-            'entry': current_price,
-            'stop_loss': stop_loss,
-            'target': round(target, 2),
-            'atr': atr,
-            'volume_ratio': volume_ratio,
-            'reversal_pattern': reversal['pattern'],
-            'reversal_strength': reversal['strength'],
-            'indicators': {
-                'ema_20': ema_20,
-                'ema_200': ema_200,
-                'vwap': vwap
+        return self.detect_signals(np.array([-1]), [(
+            open_price, high, low, close, volume,
+            ema_20_values, ema_200_values, vwap_values, atr_values
+        )])[0]
+
+    def detect_signals(
+        self,
+        signs: np.ndarray,
+        arrays: List[Tuple[np.ndarray, ...]]
+    ) -> List[Optional[Dict]]:
+        """
+        Run the BUY/SELL conditions for many candidates in one vectorized pass
+
+        Every condition only looks at the trailing SIGNAL_WINDOW candles, so
+        those tails are stacked into one block and each condition becomes a
+        column test over all candidates. Directional tests are written for
+        a BUY and mirrored for a SELL by multiplying price differences by
+        the candidate's sign. Signal dicts are built only for the
+        candidates that pass.
+
+        Args:
+            signs: Per candidate, 1 to look for a BUY or -1 for a SELL
+            arrays: Per candidate, the tuple returned by _precompute
+
+        Returns:
+            Signal dictionary or None per candidate, in input order
+        """
+        if not arrays:
+            return []
+
+        signs = np.asarray(signs)
+        block, lengths = _stack_tails(arrays, SIGNAL_WINDOW)
+        open_price, high, low, close, volume, ema_20, ema_200, vwap, atr = block.transpose(1, 0, 2)
+
+        buy = signs > 0
+        signal_config = self.config['signals']
+        pullback_pct = np.where(
+            buy,
+            signal_config['buy']['pullback_to_20ema_percent'],
+            signal_config['sell']['pullback_to_20ema_percent']
+        )
+        min_volume_ratio = np.where(
+            buy,
+            signal_config['buy']['min_volume_ratio'],
+            signal_config['sell']['min_volume_ratio']
+        )
+
+        current_price = close[:, -1]
+        latest_ema_20 = ema_20[:, -1]
+        latest_ema_200 = ema_200[:, -1]
+        latest_vwap = vwap[:, -1]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Too short, or indicators missing (NaN != NaN)
+            rejected = (lengths < MIN_SIGNAL_CANDLES) | ~(
+                (latest_ema_20 == latest_ema_20)
+                & (latest_ema_200 == latest_ema_200)
+                & (latest_vwap == latest_vwap)
+            )
+
+            # Conditions 1-2: Price beyond 200 EMA and VWAP in the trade direction
+            rejected |= signs * (current_price - latest_ema_200) <= 0
+            rejected |= signs * (current_price - latest_vwap) <= 0
+
+            # Condition 3: Pullback to 20 EMA, or a touch in the last 3 candles
+            distance_from_ema20 = np.abs((current_price - latest_ema_20) / current_price) * 100
+            rejected |= (distance_from_ema20 > pullback_pct) & ~_touched_level(low, high, ema_20, PULLBACK_LOOKBACK)
+
+            # Condition 4: Reversal candle in the trade direction; each
+            # candidate's last two candles are laid out as (previous, latest)
+            # pairs, so the classifier's one-bar shift stays within a pair
+            pairs = [values[:, -2:].ravel() for values in (open_price, high, low, close)]
+            buy_codes = self.classify_patterns_from_arrays(*pairs, signal_type='buy')[0][1::2]
+            sell_codes = self.classify_patterns_from_arrays(*pairs, signal_type='sell')[0][1::2]
+            patterns = np.where(buy, buy_codes, sell_codes)
+            rejected |= patterns == 0
+
+            # Condition 5: Higher volume (ratio 1.0 with fewer than 11 candles)
+            avg_volume = volume[:, :-1].mean(axis=1)
+            volume_ratios = np.where(
+                lengths >= SIGNAL_WINDOW,
+                np.where(avg_volume > 0, volume[:, -1] / avg_volume, 0.0),
+                1.0
+            )
+            rejected |= volume_ratios < min_volume_ratio
+
+        risk_reward_ratio = self.config['risk']['target']['risk_reward_ratio']
+        signals = [None] * len(arrays)
+
+        for i in np.flatnonzero(~rejected):
+            sign = int(signs[i])
+            _, signal_type, direction = SIGNAL_SIDES[sign]
+            entry = current_price[i]
+
+            # All conditions met - generate the signal
+            stop_loss = ATR.calculate_stop_loss(entry, atr[i, -1], multiplier=1.5, direction=direction)
+            risk = sign * (entry - stop_loss)
+            target = entry + sign * (risk * risk_reward_ratio)
+
+            signals[i] = {
+                'type': signal_type,
+                'entry': entry,
+                'stop_loss': stop_loss,
+                'target': round(target, 2),
+                'atr': atr[i, -1],
+                'volume_ratio': volume_ratios[i],
+                'reversal_pattern': PATTERN_NAMES[patterns[i]],
+                'reversal_strength': float(PATTERN_STRENGTHS[patterns[i]]),
+                'indicators': {
+                    'ema_20': latest_ema_20[i],
+                    'ema_200': latest_ema_200[i],
+                    'vwap': latest_vwap[i]
+                }
             }
-        }
 
-        return signal
+        return signals
 
     def score_signal(self, signal: Dict, data: pd.DataFrame) -> float:
         """
@@ -336,53 +457,24 @@ class SignalGenerator:
         Returns:
             Quality score (0-100)
         """
-        score = 0
-
-        # Trend strength (30 points)
-        current_price = signal['entry']
-        ema_200 = signal['indicators']['ema_200']
-        distance_from_200 = abs((current_price - ema_200) / ema_200) * 100
-
-        if distance_from_200 > 2:
-            score += 30
-        elif distance_from_200 > 1:
-            score += 20
-        else:
-            score += 10
-
-        # Volume surge (25 points)
-        volume_ratio = signal['volume_ratio']
-
-        if volume_ratio > 2:
-            score += 25
-        elif volume_ratio > 1.5:
-            score += 20
-        elif volume_ratio > 1.2:
-            score += 15
-        else:
-            score += 10
-
-        # Reversal pattern strength (25 points)
-        score += signal['reversal_strength'] * 25
-
-        # Risk-reward (20 points)
-        risk = abs(signal['entry'] - signal['stop_loss'])
-        reward = abs(signal['target'] - signal['entry'])
-        rr_ratio = reward / risk if risk > 0 else 0
-
-        if rr_ratio >= 2:
-            score += 20
-        elif rr_ratio >= 1.5:
-            score += 15
-        else:
-            score += 10
-
-        return min(score, 100)
+        return score_signal_kernel(
+            signal['entry'],
+            signal['indicators']['ema_200'],
+            signal['volume_ratio'],
+            signal['reversal_strength'],
+            abs(signal['entry'] - signal['stop_loss']),
+            abs(signal['target'] - signal['entry'])
+        )
 
     def generate_signals(self, candidates: List[Dict]) -> List[Dict]:
         """
         Generate signals for all candidates
 
+        Indicators are not recomputed here: each candidate's 'data' must
+        already carry the ema_20, ema_200, vwap and atr columns attached
+        by LiveMarketFilter.apply_trend_filter (candidates without them
+        produce no signal).
+
         Args:
             candidates: List of filtered candidate stocks
 
@@ -391,42 +483,43 @@ class SignalGenerator:
         """
         logger.info("Generating trading signals...")
 
-        signals = []
+        batch = []  # (symbol, data) per candidate sent to detect_signals
+        signs = []
+        arrays = []
 
         for candidate in candidates:
             symbol = candidate['symbol']
             data = candidate.get('data')
+            sign = TREND_SIGNS.get(candidate.get('trend'))
 
-            if data is None or data.empty:
+            if data is None or data.empty or sign is None:
                 continue
 
             try:
-                # Try BUY signal
-                if candidate.get('trend') == 'bullish':
-                    signal = self.detect_buy_signal(data)
-
-                    if signal:
-                        signal['symbol'] = symbol
-                        signal['score'] = self.score_signal(signal, data)
-                        signals.append(signal)
-                        logger.info(f"{symbol}: BUY signal (score={signal['score']:.0f})")
-
-                # Try SELL signal
-                elif candidate.get('trend') == 'bearish':
-                    signal = self.detect_sell_signal(data)
-
-                    if signal:
-                        signal['symbol'] = symbol
-                        signal['score'] = self.score_signal(signal, data)
-                        signals.append(signal)
-                        logger.info(f"{symbol}: SELL signal (score={signal['score']:.0f})")
-
+                # Column arrays extracted once per candidate
+                candidate_arrays = _precompute(data)
             except Exception as e:
                 logger.error(f"Error generating signal for {symbol}: {e}")
                 continue
 
-        # Sort by score
-        signals.sort(key=lambda x: x['score'], reverse=True)
+            if candidate_arrays is not None:
+                batch.append((symbol, data))
+                signs.append(sign)
+                arrays.append(candidate_arrays)
+
+        # Every candidate's conditions checked together
+        signals = []
+
+        for (symbol, data), signal in zip(batch, self.detect_signals(np.array(signs, dtype=np.int8), arrays)):
+            if signal:
+                signal['symbol'] = symbol
+                signal['score'] = self.score_signal(signal, data)
+                signals.append(signal)
+                logger.info(f"{symbol}: {signal['type']} signal (score={signal['score']:.0f})")
+
+        # Sort by score, descending (stable, so ties keep candidate order)
+        scores = np.fromiter((signal['score'] for signal in signals), dtype=np.float64, count=len(signals))
+        signals = [signals[i] for i in np.argsort(-scores, kind='stable')]
 
         logger.info(f"Generated {len(signals)} signals")
         return signals
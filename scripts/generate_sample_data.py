@@ -5,8 +5,25 @@ Creates synthetic OHLCV data for testing the screener
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
+import io
+
+# Prices are rounded to paise when written rather than per value
+PRICE_FORMAT = '%.2f'
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def write_csv(df: pd.DataFrame, output_file: str) -> None:
+    """
+    Write a sample data frame to CSV through a large write buffer
+
+    Args:
+        df: DataFrame to write (without its index)
+        output_file: Output CSV path
+    """
+    with io.BufferedWriter(io.FileIO(output_file, 'w'), buffer_size=WRITE_BUFFER_SIZE) as f:
+        df.to_csv(f, index=False, float_format=PRICE_FORMAT, lineterminator='\n')
 
 
 def generate_minute_data(symbol: str, date: datetime, base_price: float = 1000) -> pd.DataFrame:
@@ -25,7 +42,7 @@ def generate_minute_data(symbol: str, date: datetime, base_price: float = 1000)
     start_time = date.replace(hour=9, minute=15, second=0, microsecond=0)
     num_minutes = 375
 
-    timestamps = [start_time + timedelta(minutes=i) for i in range(num_minutes)]
+    timestamps = pd.date_range(start_time, periods=num_minutes, freq='min')
 
     # Generate realistic price movement using random walk
     np.random.seed(hash(symbol + str(date)) % 2**32)
@@ -33,37 +50,32 @@ def generate_minute_data(symbol: str, date: datetime, base_price: float = 1000)
     returns = np.random.normal(0, 0.001, num_minutes)  # 0.1% std per minute
     prices = base_price * (1 + np.cumsum(returns))
 
-    data = []
-    for i, ts in enumerate(timestamps):
-        price = prices[i]
-
-        # Generate OHLC with some noise
-        high = price * (1 + abs(np.random.normal(0, 0.002)))
-        low = price * (1 - abs(np.random.normal(0, 0.002)))
-        open_price = prices[i-1] if i > 0 else base_price
-        close_price = price
-
-        # Ensure OHLC relationships
-        high = max(high, open_price, close_price)
-        low = min(low, open_price, close_price)
-
-        # Generate volume (higher in first/last hour)
-        hour = ts.hour
-        if hour == 9 or hour == 15:
-            volume = int(np.random.uniform(50000, 150000))
-        else:
-            volume = int(np.random.uniform(20000, 80000))
-
-        data.append({
-            'timestamp': ts,
-            'open': round(open_price, 2),
-            'high': round(high, 2),
-            'low': round(low, 2),
-            'close': round(close_price, 2),
-            'volume': volume
-        })
-
-    return pd.DataFrame(data)
+    # Generate OHLC with some noise, all candles at once
+    high = prices * (1 + np.abs(np.random.normal(0, 0.002, num_minutes)))
+    low = prices * (1 - np.abs(np.random.normal(0, 0.002, num_minutes)))
+    open_prices = np.empty(num_minutes)
+    open_prices[0] = base_price
+    open_prices[1:] = prices[:-1]
+
+    # Ensure OHLC relationships
+    high = np.maximum.reduce([high, open_prices, prices])
+    low = np.minimum.reduce([low, open_prices, prices])
+
+    # Generate volume (higher in first/last hour)
+    busy = np.isin(timestamps.hour, (9, 15))
+    volume = np.random.uniform(
+        np.where(busy, 50000, 20000),
+        np.where(busy, 150000, 80000)
+    ).astype(np.int64)
+
+    return pd.DataFrame({
+        'timestamp': timestamps,
+        'open': open_prices,
+        'high': high,
+        'low': low,
+        'close': prices,
+        'volume': volume
+    }, copy=False)  # Freshly built arrays; adopt them instead of copying
 
 
 def generate_daily_data(symbol: str, end_date: datetime, days: int = 250, base_price: float = 1000) -> pd.DataFrame:
@@ -73,7 +85,7 @@ def generate_daily_data(symbol: str, end_date: datetime, days: int = 250, base_p
     Args:
         symbol: Stock symbol
         end_date: End date
-        days: Number of days
+        days: Number of trading days (weekdays) ending at end_date
         base_price: Starting price
 
     Returns:
@@ -81,37 +93,31 @@ def generate_daily_data(symbol: str, end_date: datetime, days: int = 250, base_p
     """
     np.random.seed(hash(symbol) % 2**32)
 
-    dates = [end_date - timedelta(days=i) for i in range(days)]
-    dates.reverse()
-    dates = [d for d in dates if d.weekday() < 5]  # Remove weekends
+    dates = pd.bdate_range(end=end_date, periods=days)  # Weekdays only
+    num_days = len(dates)
 
-    returns = np.random.normal(0, 0.015, len(dates))  # 1.5% daily std
+    returns = np.random.normal(0, 0.015, num_days)  # 1.5% daily std
     prices = base_price * (1 + np.cumsum(returns))
 
-    data = []
-    for i, date in enumerate(dates):
-        price = prices[i]
-
-        high = price * (1 + abs(np.random.normal(0, 0.02)))
-        low = price * (1 - abs(np.random.normal(0, 0.02)))
-        open_price = prices[i-1] if i > 0 else base_price
-        close_price = price
-
-        high = max(high, open_price, close_price)
-        low = min(low, open_price, close_price)
+    high = prices * (1 + np.abs(np.random.normal(0, 0.02, num_days)))
+    low = prices * (1 - np.abs(np.random.normal(0, 0.02, num_days)))
+    open_prices = np.empty(num_days)
+    open_prices[:1] = base_price
+    open_prices[1:] = prices[:-1]
 
-        volume = int(np.random.uniform(5000000, 15000000))
+    high = np.maximum.reduce([high, open_prices, prices])
+    low = np.minimum.reduce([low, open_prices, prices])
 
-        data.append({
-            'date': date.strftime('%Y-%m-%d'),
-            'open': round(open_price, 2),
-            'high': round(high, 2),
-            'low': round(low, 2),
-            'close': round(close_price, 2),
-            'volume': volume
-        })
+    volume = np.random.uniform(5000000, 15000000, num_days).astype(np.int64)
 
-    return pd.DataFrame(data)
+    return pd.DataFrame({
+        'date': dates.strftime('%Y-%m-%d'),
+        'open': open_prices,
+        'high': high,
+        'low': low,
+        'close': prices,
+        'volume': volume
+    }, copy=False)  # Freshly built arrays; adopt them instead of copying
 
 
 def main():
@@ -145,7 +151,7 @@ def main():
     for symbol, base_price in stocks.items():
         minute_data = generate_minute_data(symbol, test_date, base_price)
         output_file = f'data/sample/minute/{symbol}_minute.csv'
-        minute_data.to_csv(output_file, index=False)
+        write_csv(minute_data, output_file)
         print(f"  ✅ {symbol}: {len(minute_data)} candles -> {output_file}")
 
     # Generate daily data
@@ -153,7 +159,7 @@ def main():
     for symbol, base_price in {**stocks, **indices}.items():
         daily_data = generate_daily_data(symbol, test_date, days=250, base_price=base_price)
         output_file = f'data/sample/daily/{symbol}_daily.csv'
-        daily_data.to_csv(output_file, index=False)
+        write_csv(daily_data, output_file)
         print(f"  ✅ {symbol}: {len(daily_data)} candles -> {output_file}")
 
     # Generate news file
@@ -172,7 +178,7 @@ def main():
             'description': 'Dividend Declaration'
         }
     ])
-    news_data.to_csv('data/sample/news.csv', index=False)
+    write_csv(news_data, 'data/sample/news.csv')
     print(f"  ✅ News data -> data/sample/news.csv")
 
     print("\n✅ Sample data generation complete!")
@@ -7,20 +7,102 @@ import yfinance as yf
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Optional
 import pytz
+import time
+
+# How long fetched history is reused: intraday bars move every minute,
+# daily and longer bars only change once a day
+INTRADAY_HISTORY_TTL = 60
+DAILY_HISTORY_TTL = 60 * 60
+DAILY_INTERVALS = {'1d', '5d', '1wk', '1mo', '3mo'}
+
+# One fetch per symbol and bar size serves the derived queries (latest
+# price, previous close, average volume, pivots, index trend)
+MINUTE_HISTORY_PERIOD = '5d'
+DAILY_HISTORY_PERIOD = '6mo'
+
+
+def _top_levels(levels: np.ndarray, k: int = 3) -> List[float]:
+    """
+    The k highest distinct levels, highest first
+
+    argpartition picks the k largest values without a full sort; only if
+    those contain duplicates does it fall back to sorting every level.
+
+    Args:
+        levels: Candidate price levels
+        k: Number of levels to keep
+
+    Returns:
+        List of up to k distinct levels in descending order
+    """
+    if len(levels) > k:
+        top = np.unique(levels[np.argpartition(levels, -k)[-k:]])
+        if len(top) == k:
+            return top[::-1].tolist()
+
+    return np.unique(levels)[::-1][:k].tolist()
+
+
+@lru_cache(maxsize=1024)
+def get_ticker(symbol: str) -> yf.Ticker:
+    """Shared yfinance Ticker per symbol (construction is not free)"""
+    return yf.Ticker(symbol)
+
 
 class DataFetcher:
     """Fetches stock data for Indian markets"""
 
     def __init__(self):
         self.ist_tz = pytz.timezone('Asia/Kolkata')
+        # (symbol, period, interval) -> (fetch time, data)
+        self._history_cache = {}
+
+    def _cached_history(self, symbol: str, period: str, interval: str) -> pd.DataFrame:
+        """
+        Fetch price history, reusing a recent fetch of the same request
+
+        Args:
+            symbol: Stock symbol
+            period: Data period
+            interval: Data interval
+
+        Returns:
+            DataFrame shared with the cache (do not modify; see _history)
+        """
+        key = (symbol, period, interval)
+        ttl = DAILY_HISTORY_TTL if interval in DAILY_INTERVALS else INTRADAY_HISTORY_TTL
+        cached = self._history_cache.get(key)
+
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        data = get_ticker(symbol).history(period=period, interval=interval)
+
+        # Empty results (often transient failures) are not kept
+        if not data.empty:
+            self._history_cache[key] = (time.monotonic(), data)
+
+        return data
+
+    def _history(self, symbol: str, period: str, interval: str) -> pd.DataFrame:
+        """Copy of _cached_history's result (callers may modify it freely)"""
+        return self._cached_history(symbol, period, interval).copy()
+
+    def _minute(self, symbol: str) -> pd.DataFrame:
+        """Recent 1-minute history (shared, do not modify)"""
+        return self._cached_history(symbol, MINUTE_HISTORY_PERIOD, '1m')
+
+    def _daily(self, symbol: str) -> pd.DataFrame:
+        """Recent daily history (shared, do not modify)"""
+        return self._cached_history(symbol, DAILY_HISTORY_PERIOD, '1d')
 
     def get_current_price(self, symbol: str) -> Optional[float]:
         """Get current/latest price for a symbol"""
         try:
-            ticker = yf.Ticker(symbol)
-            data = ticker.history(period='1d', interval='1m')
+            data = self._minute(symbol)
             if not data.empty:
                 return data['Close'].iloc[-1]
             return None
@@ -46,9 +128,7 @@ class DataFetcher:
             DataFrame with OHLCV data
         """
         try:
-            ticker = yf.Ticker(symbol)
-            data = ticker.history(period=period, interval=interval)
-            return data
+            return self._history(symbol, period=period, interval=interval)
         except Exception as e:
             print(f"Error fetching historical data for {symbol}: {e}")
             return pd.DataFrame()
@@ -65,9 +145,8 @@ class DataFetcher:
             DataFrame with intraday OHLCV data
         """
         try:
-            ticker = yf.Ticker(symbol)
             # Get last 5 days of data to ensure we have today's data
-            data = ticker.history(period='5d', interval=interval)
+            data = self._history(symbol, period='5d', interval=interval)
 
             # Filter for today only
             today = datetime.now(self.ist_tz).date()
@@ -83,8 +162,7 @@ class DataFetcher:
     def get_previous_close(self, symbol: str) -> Optional[float]:
         """Get previous day's closing price"""
         try:
-            ticker = yf.Ticker(symbol)
-            data = ticker.history(period='5d', interval='1d')
+            data = self._daily(symbol)
             if len(data) >= 2:
                 return data['Close'].iloc[-2]
             return None
@@ -100,9 +178,8 @@ class DataFetcher:
             Dictionary with pre-open price, volume, etc.
         """
         try:
-            ticker = yf.Ticker(symbol)
-            # Get pre-market data
-            data = ticker.history(period='1d', interval='1m', prepost=True)
+            # Get pre-market data (extended hours, so not shared via _history)
+            data = get_ticker(symbol).history(period='1d', interval='1m', prepost=True)
 
             if data.empty:
                 return {}
@@ -142,39 +219,37 @@ class DataFetcher:
 
         Args:
             symbol: Stock symbol
-            lookback_days: Number of days to look back
+            lookback_days: Number of trading days (daily candles) to look back
 
         Returns:
             Dictionary with support and resistance levels
         """
         try:
-            data = self.get_historical_data(symbol, period=f'{lookback_days}d', interval='1d')
+            data = self._daily(symbol).iloc[-lookback_days:]
 
             if data.empty or len(data) < 5:
                 return {'support': [], 'resistance': []}
 
-            # Find pivot points
+            # Find pivot points: candles beyond both neighbours on each side
             highs = data['High'].values
             lows = data['Low'].values
-
-            resistance_levels = []
-            support_levels = []
-
-            # Find local maxima (resistance)
-            for i in range(2, len(highs) - 2):
-                if highs[i] > highs[i-1] and highs[i] > highs[i-2] and \
-                   highs[i] > highs[i+1] and highs[i] > highs[i+2]:
-                    resistance_levels.append(highs[i])
-
-            # Find local minima (support)
-            for i in range(2, len(lows) - 2):
-                if lows[i] < lows[i-1] and lows[i] < lows[i-2] and \
-                   lows[i] < lows[i+1] and lows[i] < lows[i+2]:
-                    support_levels.append(lows[i])
-
-            # Sort and return top 3 of each
-            resistance_levels = sorted(list(set(resistance_levels)), reverse=True)[:3]
-            support_levels = sorted(list(set(support_levels)), reverse=True)[:3]
+            mid_highs = highs[2:-2]
+            mid_lows = lows[2:-2]
+
+            # Local maxima (resistance)
+            is_peak = (
+                (mid_highs > highs[1:-3]) & (mid_highs > highs[:-4]) &
+                (mid_highs > highs[3:-1]) & (mid_highs > highs[4:])
+            )
+            # Local minima (support)
+            is_trough = (
+                (mid_lows < lows[1:-3]) & (mid_lows < lows[:-4]) &
+                (mid_lows < lows[3:-1]) & (mid_lows < lows[4:])
+            )
+
+            # Top 3 distinct levels of each, highest first
+            resistance_levels = _top_levels(mid_highs[is_peak])
+            support_levels = _top_levels(mid_lows[is_trough])
 
             return {
                 'resistance': resistance_levels,
@@ -187,11 +262,11 @@ class DataFetcher:
             return {'support': [], 'resistance': []}
 
     def get_average_volume(self, symbol: str, days: int = 20) -> Optional[float]:
-        """Get average volume over specified days"""
+        """Get average volume over the last `days` trading days"""
         try:
-            data = self.get_historical_data(symbol, period=f'{days}d', interval='1d')
+            data = self._daily(symbol)
             if not data.empty:
-                return data['Volume'].mean()
+                return data['Volume'].iloc[-days:].mean()
             return None
         except Exception as e:
             print(f"Error calculating average volume for {symbol}: {e}")
@@ -208,19 +283,17 @@ class DataFetcher:
             Dictionary with trend information
         """
         try:
-            data = self.get_historical_data(index_symbol, period='3mo', interval='1d')
+            data = self._daily(index_symbol)
 
             if data.empty or len(data) < 50:
                 return {'trend': 'unknown'}
 
-            # Calculate moving averages
-            data['SMA_20'] = data['Close'].rolling(window=20).mean()
-            data['SMA_50'] = data['Close'].rolling(window=50).mean()
-
-            latest = data.iloc[-1]
-            current_price = latest['Close']
-            sma_20 = latest['SMA_20']
-            sma_50 = latest['SMA_50']
+            # Only the latest moving averages are used: average the last
+            # 20/50 closes instead of building full rolling series
+            closes = data['Close'].to_numpy()
+            current_price = closes[-1]
+            sma_20 = closes[-20:].mean()
+            sma_50 = closes[-50:].mean()
 
             # Determine trend
             if current_price > sma_20 > sma_50:
@@ -235,7 +308,7 @@ class DataFetcher:
                 'current_price': current_price,
                 'sma_20': sma_20,
                 'sma_50': sma_50,
-                'change_pct': ((current_price - data['Close'].iloc[-2]) / data['Close'].iloc[-2]) * 100
+                'change_pct': ((current_price - closes[-2]) / closes[-2]) * 100
             }
         except Exception as e:
             print(f"Error determining trend for {index_symbol}: {e}")
@@ -4,11 +4,15 @@ Provides fallback functionality for testing when live intraday data is unavailab
 """
 
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
 
 from .data_fetcher import DataFetcher
 from .technical_indicators import TechnicalIndicators
 
+# Concurrent per-symbol fetches (network-bound, so threads suffice)
+FETCH_WORKERS = 16
+
 
 class DemoHelper:
     """
@@ -83,16 +87,23 @@ class DemoHelper:
             'no_data': []
         }
 
-        for symbol in symbols:
+        def classify(symbol: str) -> str:
             intraday = self.data_fetcher.get_intraday_data(symbol, interval='5m')
 
             if not intraday.empty and len(intraday) >= 50:
-                status['intraday_available'].append(symbol)
-            else:
-                daily = self.data_fetcher.get_historical_data(symbol, period='1mo', interval='1d')
-                if not daily.empty and len(daily) >= 20:
-                    status['daily_only'].append(symbol)
-                else:
-                    status['no_data'].append(symbol)
+                return 'intraday_available'
+
+            daily = self.data_fetcher.get_historical_data(symbol, period='1mo', interval='1d')
+            if not daily.empty and len(daily) >= 20:
+                return 'daily_only'
+            return 'no_data'
+
+        if not symbols:
+            return status
+
+        # Check every symbol concurrently; map() keeps the symbol order
+        with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(symbols))) as executor:
+            for symbol, category in zip(symbols, executor.map(classify, symbols)):
+                status[category].append(symbol)
 
         return status
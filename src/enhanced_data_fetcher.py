@@ -2,14 +2,222 @@
 Enhanced Data Fetcher with better error handling and retry logic
 """
 
-import yfinance as yf
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, time as dtime
+from functools import wraps
+from pathlib import Path
 from typing import Dict, List, Optional
+import io
+import os
 import pytz
+import sys
+import tempfile
+import threading
 import time
 
+from .data_fetcher import get_ticker
+
+
+# On-disk cache of fetched OHLCV data (one parquet file per symbol/interval)
+CACHE_DIR = Path.home() / '.cache' / 'st-ml'
+
+# (label, interval, period) checked by diagnose_data_availability
+AVAILABILITY_PROBES = (
+    ('1-minute', '1m', '1d'),
+    ('5-minute', '5m', '5d'),
+    ('15-minute', '15m', '5d'),
+    ('daily', '1d', '1mo'),
+)
+
+# Background refreshes of stale cache entries (daemon threads, so a
+# pending refresh never holds up interpreter exit)
+MAX_BACKGROUND_REFRESHES = 4
+_refresh_slots = threading.BoundedSemaphore(MAX_BACKGROUND_REFRESHES)
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+
+def _write_cache(data: pd.DataFrame, cache_path: Path):
+    """
+    Atomically write data to a parquet cache file
+
+    The frame is written to a temporary file in the cache directory and
+    then renamed over cache_path, so readers never see a partial file.
+
+    Args:
+        data: Data to cache
+        cache_path: Destination parquet file
+    """
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, prefix=cache_path.stem, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            data.to_parquet(f)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class _ThreadBufferedStdout:
+    """sys.stdout stand-in that sends a thread's writes to its own buffer, if it has one"""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    @property
+    def buffer(self) -> Optional[io.StringIO]:
+        return getattr(self._local, 'buffer', None)
+
+    @buffer.setter
+    def buffer(self, value: Optional[io.StringIO]):
+        self._local.buffer = value
+
+    def write(self, text: str) -> int:
+        return (self.buffer or self._stream).write(text)
+
+    def flush(self):
+        (self.buffer or self._stream).flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+class BufferedOutputExecutor(ThreadPoolExecutor):
+    """
+    Thread pool that buffers what each task prints
+
+    While the executor is open, sys.stdout is replaced by a proxy that
+    collects each task's output separately (other threads still print
+    directly). Futures resolve to (result, output), so verbose fetches
+    can run concurrently and their traces be printed in a fixed order.
+    """
+
+    def __enter__(self):
+        self._stdout = _ThreadBufferedStdout(sys.stdout)
+        sys.stdout = self._stdout
+        return super().__enter__()
+
+    def __exit__(self, *exc_info):
+        try:
+            return super().__exit__(*exc_info)
+        finally:
+            sys.stdout = self._stdout._stream
+
+    def submit(self, fn, /, *args, **kwargs):
+        def buffered():
+            self._stdout.buffer = io.StringIO()
+            try:
+                return fn(*args, **kwargs), self._stdout.buffer.getvalue()
+            finally:
+                self._stdout.buffer = None
+
+        return super().submit(buffered)
+
+
+def stale_while_revalidate(max_age_seconds: float, max_stale_seconds: float):
+    """
+    Cache an intraday fetch method on disk with stale-while-revalidate
+
+    Only cached data from the current (IST) trading day is used:
+    - Fresh cache (younger than max_age_seconds): served directly
+    - Stale cache (younger than max_stale_seconds): served immediately,
+      refreshed in the background
+    - No cache, or cache older than max_stale_seconds: fetched synchronously
+    If a synchronous fetch comes back empty (network failure), today's
+    cached data is served instead, however old.
+
+    Results tagged with a different interval in data.attrs['interval']
+    (e.g. a 15m fallback for a 5m request) are returned but not cached.
+    Passing use_cache=False fetches live without touching the cache (it is
+    passed on to the method, for nested fetches).
+
+    Args:
+        max_age_seconds: Freshness window for cached data
+        max_stale_seconds: Hard limit on the age of data served without
+            a synchronous fetch
+
+    Returns:
+        Decorator for methods with signature (self, symbol, interval, verbose, use_cache)
+    """
+    def decorator(fetch):
+        @wraps(fetch)
+        def wrapper(
+            self,
+            symbol: str,
+            interval: str = '5m',
+            verbose: bool = False,
+            use_cache: bool = True
+        ) -> pd.DataFrame:
+            if not use_cache:
+                return fetch(self, symbol, interval=interval, verbose=verbose, use_cache=False)
+
+            cache_path = CACHE_DIR / f"{symbol}_{interval}.parquet"
+
+            def refresh() -> pd.DataFrame:
+                data = fetch(self, symbol, interval=interval, verbose=verbose)
+                if not data.empty and data.attrs.get('interval', interval) == interval:
+                    try:
+                        _write_cache(data, cache_path)
+                    except Exception as e:
+                        print(f"Error caching {symbol} ({interval}): {e}")
+                return data
+
+            def background_refresh():
+                try:
+                    with _refresh_slots:
+                        refresh()
+                except Exception as e:
+                    print(f"Error refreshing {symbol} ({interval}): {e}")
+                finally:
+                    with _refreshing_lock:
+                        _refreshing.discard(cache_path)
+
+            cached = None
+            if cache_path.exists():
+                try:
+                    age = time.time() - cache_path.stat().st_mtime
+                    cached = pd.read_parquet(cache_path)
+                except Exception as e:
+                    print(f"Error reading cache for {symbol} ({interval}): {e}")
+
+            today = datetime.now(self.ist_tz).date()
+            if cached is not None and (cached.empty or cached.index[-1].date() != today):
+                cached = None
+
+            if cached is not None:
+                if age <= max_age_seconds:
+                    return cached
+
+                if age <= max_stale_seconds:
+                    # Stale: serve it now and refresh in the background
+                    with _refreshing_lock:
+                        start_refresh = cache_path not in _refreshing
+                        _refreshing.add(cache_path)
+                    if start_refresh:
+                        threading.Thread(target=background_refresh, daemon=True).start()
+                    return cached
+
+            # Too old to serve as is (or missing): fetch synchronously
+            data = refresh()
+
+            if data.empty and cached is not None:
+                if verbose:
+                    print(f"      ⚠ Fetch failed, using cached data for {symbol}")
+                return cached
+
+            return data
+
+        return wrapper
+
+    return decorator
+
 
 class EnhancedDataFetcher:
     """
@@ -20,12 +228,37 @@ class EnhancedDataFetcher:
         self.ist_tz = pytz.timezone('Asia/Kolkata')
         self.max_retries = 3
         self.retry_delay = 2  # seconds
+        self.retry_backoff = 0.5  # seconds, doubled after each failed request
+
+    def _session_slice(self, data: pd.DataFrame, day) -> pd.DataFrame:
+        """
+        Rows of data from one IST calendar day, with the index in IST
+
+        The day's bounds are located with one binary search on the
+        (time-sorted) index, and only those rows are converted to IST.
+
+        Args:
+            data: Price history with a datetime index (naive means UTC)
+            day: IST date to keep
+
+        Returns:
+            The rows from that day
+        """
+        index = data.index if data.index.tz is not None else data.index.tz_localize('UTC')
+        day_start = self.ist_tz.localize(datetime.combine(day, dtime.min))
+        start, end = index.searchsorted([day_start, day_start + timedelta(days=1)])
 
+        session = data.iloc[start:end].copy()
+        session.index = index[start:end].tz_convert(self.ist_tz)
+        return session
+
+    @stale_while_revalidate(max_age_seconds=15 * 60, max_stale_seconds=60 * 60)
     def get_intraday_data_robust(
         self,
         symbol: str,
         interval: str = '5m',
-        verbose: bool = False
+        verbose: bool = False,
+        use_cache: bool = True
     ) -> pd.DataFrame:
         """
         Fetch intraday data with multiple fallback strategies
@@ -34,6 +267,8 @@ class EnhancedDataFetcher:
             symbol: Stock symbol
             interval: Candle interval
             verbose: Print debug information
+            use_cache: Use the on-disk cache (handled by stale_while_revalidate;
+                also applies to the 15m fallback)
 
         Returns:
             DataFrame with intraday data
@@ -41,24 +276,21 @@ class EnhancedDataFetcher:
         if verbose:
             print(f"    Fetching {interval} data for {symbol}...")
 
+        today = datetime.now(self.ist_tz).date()
+
         # Strategy 1: Try today's data with multiple period options
-        for period in ['1d', '2d', '5d', '7d']:
+        periods = ['1d', '2d', '5d', '7d']
+        for attempt, period in enumerate(periods):
             try:
                 if verbose:
                     print(f"      Trying period={period}...")
 
-                ticker = yf.Ticker(symbol)
+                ticker = get_ticker(symbol)
                 data = ticker.history(period=period, interval=interval)
 
                 if not data.empty:
-                    # Convert to IST
-                    if data.index.tz is None:
-                        data.index = data.index.tz_localize('UTC')
-                    data.index = data.index.tz_convert(self.ist_tz)
-
-                    # Filter for today
-                    today = datetime.now(self.ist_tz).date()
-                    data = data[data.index.date == today]
+                    # Today's candles, indexed in IST
+                    data = self._session_slice(data, today)
 
                     if len(data) >= 10:  # At least 10 candles (50 minutes of data)
                         if verbose:
@@ -67,11 +299,14 @@ class EnhancedDataFetcher:
                     elif verbose:
                         print(f"      ✗ Only {len(data)} candles")
 
-                time.sleep(0.5)  # Brief delay between attempts
-
             except Exception as e:
                 if verbose:
                     print(f"      ✗ Error with period={period}: {e}")
+
+                # Back off exponentially, but only after a failed request;
+                # a short answer moves on to the next period at once
+                if attempt < len(periods) - 1:
+                    time.sleep(self.retry_backoff * 2 ** attempt)
                 continue
 
         # Strategy 2: Try with specific date range
@@ -79,18 +314,14 @@ class EnhancedDataFetcher:
             if verbose:
                 print(f"      Trying specific date range...")
 
-            today = datetime.now(self.ist_tz).date()
             start_date = today - timedelta(days=1)
             end_date = today + timedelta(days=1)
 
-            ticker = yf.Ticker(symbol)
+            ticker = get_ticker(symbol)
             data = ticker.history(start=start_date, end=end_date, interval=interval)
 
             if not data.empty:
-                if data.index.tz is None:
-                    data.index = data.index.tz_localize('UTC')
-                data.index = data.index.tz_convert(self.ist_tz)
-                data = data[data.index.date == today]
+                data = self._session_slice(data, today)
 
                 if len(data) >= 10:
                     if verbose:
@@ -106,8 +337,10 @@ class EnhancedDataFetcher:
             if verbose:
                 print(f"      Trying 15m interval as fallback...")
 
-            result = self.get_intraday_data_robust(symbol, interval='15m', verbose=False)
+            result = self.get_intraday_data_robust(symbol, interval='15m', verbose=False, use_cache=use_cache)
             if not result.empty:
+                # Keep the 15m candles out of the 5m cache entry
+                result.attrs['interval'] = '15m'
                 if verbose:
                     print(f"      ✓ Got {len(result)} candles with 15m interval")
                 return result
@@ -130,7 +363,7 @@ class EnhancedDataFetcher:
         """
         # Method 1: Latest minute data
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = get_ticker(symbol)
             data = ticker.history(period='1d', interval='1m')
             if not data.empty:
                 price = data['Close'].iloc[-1]
@@ -153,7 +386,7 @@ class EnhancedDataFetcher:
 
         # Method 3: Daily data (last close)
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = get_ticker(symbol)
             data = ticker.history(period='2d', interval='1d')
             if not data.empty:
                 price = data['Close'].iloc[-1]
@@ -165,7 +398,7 @@ class EnhancedDataFetcher:
 
         # Method 4: ticker.info (least reliable for NSE)
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = get_ticker(symbol)
             info = ticker.info
             if 'currentPrice' in info:
                 price = info['currentPrice']
@@ -204,73 +437,35 @@ class EnhancedDataFetcher:
             'available_data': []
         }
 
-        # Check 1-minute data
-        print("\n1. Checking 1-minute data...")
-        try:
-            ticker = yf.Ticker(symbol)
-            data = ticker.history(period='1d', interval='1m')
-            if not data.empty:
-                print(f"   ✓ Available: {len(data)} candles")
-                result['available_data'].append({
-                    'interval': '1m',
-                    'candles': len(data),
-                    'latest_time': data.index[-1] if len(data) > 0 else None
-                })
-            else:
-                print(f"   ✗ No data available")
-        except Exception as e:
-            print(f"   ✗ Error: {e}")
-
-        # Check 5-minute data
-        print("\n2. Checking 5-minute data...")
-        try:
-            ticker = yf.Ticker(symbol)
-            data = ticker.history(period='5d', interval='5m')
-            if not data.empty:
-                print(f"   ✓ Available: {len(data)} candles")
-                result['available_data'].append({
-                    'interval': '5m',
-                    'candles': len(data),
-                    'latest_time': data.index[-1] if len(data) > 0 else None
-                })
-            else:
-                print(f"   ✗ No data available")
-        except Exception as e:
-            print(f"   ✗ Error: {e}")
-
-        # Check 15-minute data
-        print("\n3. Checking 15-minute data...")
-        try:
-            ticker = yf.Ticker(symbol)
-            data = ticker.history(period='5d', interval='15m')
-            if not data.empty:
-                print(f"   ✓ Available: {len(data)} candles")
-                result['available_data'].append({
-                    'interval': '15m',
-                    'candles': len(data),
-                    'latest_time': data.index[-1] if len(data) > 0 else None
-                })
-            else:
-                print(f"   ✗ No data available")
-        except Exception as e:
-            print(f"   ✗ Error: {e}")
+        # One Ticker for every probe below; the probes are independent
+        # requests, so they run together and are reported in order
+        ticker = get_ticker(symbol)
 
-        # Check daily data
-        print("\n4. Checking daily data...")
-        try:
-            ticker = yf.Ticker(symbol)
-            data = ticker.history(period='1mo', interval='1d')
-            if not data.empty:
+        def probe(interval: str, period: str):
+            try:
+                return ticker.history(period=period, interval=interval), None
+            except Exception as e:
+                return None, e
+
+        with ThreadPoolExecutor(max_workers=len(AVAILABILITY_PROBES)) as executor:
+            outcomes = list(executor.map(
+                lambda spec: probe(spec[1], spec[2]),
+                AVAILABILITY_PROBES
+            ))
+
+        for step, ((label, interval, _), (data, error)) in enumerate(zip(AVAILABILITY_PROBES, outcomes), 1):
+            print(f"\n{step}. Checking {label} data...")
+            if error is not None:
+                print(f"   ✗ Error: {error}")
+            elif not data.empty:
                 print(f"   ✓ Available: {len(data)} candles")
                 result['available_data'].append({
-                    'interval': '1d',
+                    'interval': interval,
                     'candles': len(data),
                     'latest_time': data.index[-1] if len(data) > 0 else None
                 })
             else:
                 print(f"   ✗ No data available")
-        except Exception as e:
-            print(f"   ✗ Error: {e}")
 
         # Check current price
         print("\n5. Checking current price...")
@@ -313,24 +508,34 @@ def test_data_fetching(symbols: List[str] = None):
 
     results = []
 
-    for symbol in symbols:
-        print(f"\n\nTesting {symbol}...")
-        print("-" * 60)
+    # Start every symbol's robust intraday fetch up front (network-bound),
+    # live and verbose; each trace is buffered and printed with its symbol
+    # while the diagnostics below print in order
+    with BufferedOutputExecutor(max_workers=max(1, min(16, len(symbols)))) as executor:
+        intraday_fetches = [
+            executor.submit(fetcher.get_intraday_data_robust, symbol, interval='5m', verbose=True, use_cache=False)
+            for symbol in symbols
+        ]
 
-        # Diagnose
-        diagnosis = fetcher.diagnose_data_availability(symbol)
-        results.append(diagnosis)
+        for symbol, intraday_fetch in zip(symbols, intraday_fetches):
+            print(f"\n\nTesting {symbol}...")
+            print("-" * 60)
 
-        # Try robust fetch
-        print(f"\nAttempting robust intraday fetch...")
-        data = fetcher.get_intraday_data_robust(symbol, interval='5m', verbose=True)
+            # Diagnose
+            diagnosis = fetcher.diagnose_data_availability(symbol)
+            results.append(diagnosis)
 
-        if not data.empty:
-            print(f"\n✓ SUCCESS: Got {len(data)} candles")
-            print(f"  Latest candle: {data.index[-1]}")
-            print(f"  Latest close: ₹{data['Close'].iloc[-1]:.2f}")
-        else:
-            print(f"\n✗ FAILED: Could not get intraday data")
+            # Robust fetch (started above)
+            print(f"\nAttempting robust intraday fetch...")
+            data, trace = intraday_fetch.result()
+            print(trace, end='')
+
+            if not data.empty:
+                print(f"\n✓ SUCCESS: Got {len(data)} candles")
+                print(f"  Latest candle: {data.index[-1]}")
+                print(f"  Latest close: ₹{data['Close'].iloc[-1]:.2f}")
+            else:
+                print(f"\n✗ FAILED: Could not get intraday data")
 
     # Summary
     print("\n\n" + "="*60)
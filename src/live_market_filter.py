@@ -5,11 +5,11 @@ Refines candidates after market open (9:20 AM onwards)
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Optional, Union
 
 from .data_fetcher import DataFetcher
 from .technical_indicators import TechnicalIndicators
-from config.config import TRADING_CONFIG
+from config.config import TradingConfig
 
 
 class LiveMarketFilter:
@@ -18,8 +18,8 @@ class LiveMarketFilter:
     Uses trend, volume, range, and location filters
     """
 
-    def __init__(self, config: dict = None, demo_mode: bool = False):
-        self.config = config or TRADING_CONFIG
+    def __init__(self, config: Optional[Union[TradingConfig, Dict]] = None, demo_mode: bool = False):
+        self.config = TradingConfig.from_config(config)
         self.data_fetcher = DataFetcher()
         self.tech_indicators = TechnicalIndicators()
         self.final_candidates = []
@@ -138,7 +138,7 @@ class LiveMarketFilter:
 
                 # Filter criteria
                 min_volume_surge = 1.0  # At least equal to average
-                min_range_pct = self.config['min_range_pct']
+                min_range_pct = self.config.min_range_pct
 
                 if volume_surge >= min_volume_surge and today_range_pct >= min_range_pct:
                     stock_info['volume_surge'] = volume_surge
@@ -295,7 +295,7 @@ class LiveMarketFilter:
         final_stocks.sort(key=lambda x: (x['trend_strength'], x['volume_surge']), reverse=True)
 
         # Select top 3-4
-        max_final = self.config['live_market_candidates']
+        max_final = self.config.live_market_candidates
         self.final_candidates = final_stocks[:max_final]
 
         # Final output
@@ -5,11 +5,11 @@ Screens stocks before market open (8:45 - 9:15 AM)
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Optional, Union
 from datetime import datetime, timedelta
 
 from .data_fetcher import DataFetcher
-from config.config import TRADING_CONFIG, NIFTY_50_STOCKS, INDICES
+from config.config import TradingConfig, NIFTY_50_STOCKS, INDICES
 
 
 class PreMarketScreener:
@@ -18,8 +18,8 @@ class PreMarketScreener:
     Filters stocks based on gaps, liquidity, and news
     """
 
-    def __init__(self, config: dict = None):
-        self.config = config or TRADING_CONFIG
+    def __init__(self, config: Optional[Union[TradingConfig, Dict]] = None):
+        self.config = TradingConfig.from_config(config)
         self.data_fetcher = DataFetcher()
         self.candidates = []
 
@@ -102,7 +102,7 @@ class PreMarketScreener:
                 gap_pct = ((current_price - prev_close) / prev_close) * 100
 
                 # Filter based on gap range
-                if self.config['gap_min_pct'] <= abs(gap_pct) <= self.config['gap_max_pct']:
+                if self.config.gap_min_pct <= abs(gap_pct) <= self.config.gap_max_pct:
                     gap_direction = 'up' if gap_pct > 0 else 'down'
 
                     # Prefer gaps in same direction as Nifty
@@ -160,7 +160,7 @@ class PreMarketScreener:
                 # Get average volume
                 avg_volume = self.data_fetcher.get_average_volume(
                     symbol,
-                    self.config['volume_lookback_days']
+                    self.config.volume_lookback_days
                 )
 
                 if avg_volume is None or avg_volume < 100000:  # Skip very low volume stocks
@@ -282,7 +282,7 @@ class PreMarketScreener:
         final_stocks = self.apply_news_filter(liquid_stocks)
 
         # Select top candidates
-        max_candidates = self.config['pre_market_candidates']
+        max_candidates = self.config.pre_market_candidates
         self.candidates = final_stocks[:max_candidates]
 
         # Final output
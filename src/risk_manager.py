@@ -4,10 +4,10 @@ Manages trading risk, position sizing, and trade tracking
 """
 
 import pandas as pd
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime
 
-from config.config import TRADING_CONFIG
+from config.config import TradingConfig
 
 
 class RiskManager:
@@ -19,15 +19,15 @@ class RiskManager:
     - Track daily P&L
     """
 
-    def __init__(self, capital: float, config: dict = None):
+    def __init__(self, capital: float, config: Optional[Union[TradingConfig, Dict]] = None):
         self.capital = capital
         self.initial_capital = capital
-        self.config = config or TRADING_CONFIG
+        self.config = TradingConfig.from_config(config)
 
         # Trading limits
-        self.risk_per_trade_pct = self.config['risk_per_trade_pct']
-        self.max_trades_per_day = self.config['max_trades_per_day']
-        self.max_consecutive_losses = self.config['max_consecutive_losses']
+        self.risk_per_trade_pct = self.config.risk_per_trade_pct
+        self.max_trades_per_day = self.config.max_trades_per_day
+        self.max_consecutive_losses = self.config.max_consecutive_losses
 
         # Trade tracking
         self.trades = []
@@ -5,7 +5,9 @@ Calculates various technical indicators for trading strategies
 
 import pandas as pd
 import numpy as np
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional, Union
+
+from config.config import TradingConfig
 
 
 class TechnicalIndicators:
@@ -288,39 +290,33 @@ class TechnicalIndicators:
         return lower_highs and lower_lows
 
     @staticmethod
-    def add_all_indicators(data: pd.DataFrame, config: dict = None) -> pd.DataFrame:
+    def add_all_indicators(data: pd.DataFrame, config: Optional[Union[TradingConfig, Dict]] = None) -> pd.DataFrame:
         """
         Add all common technical indicators to the dataframe
 
         Args:
             data: DataFrame with OHLCV data
-            config: Configuration dictionary with indicator parameters
+            config: TradingConfig or config dict with indicator parameters (default: CONFIG)
 
         Returns:
             DataFrame with all indicators added
         """
-        if config is None:
-            config = {
-                'ema_fast': 20,
-                'ema_slow': 200,
-                'atr_period': 14,
-                'rsi_period': 14,
-            }
+        config = TradingConfig.from_config(config)
 
         df = data.copy()
 
         # EMAs
-        df['EMA_20'] = TechnicalIndicators.calculate_ema(df, config.get('ema_fast', 20))
-        df['EMA_200'] = TechnicalIndicators.calculate_ema(df, config.get('ema_slow', 200))
+        df['EMA_20'] = TechnicalIndicators.calculate_ema(df, config.ema_fast)
+        df['EMA_200'] = TechnicalIndicators.calculate_ema(df, config.ema_slow)
 
         # VWAP (for intraday data)
         df['VWAP'] = TechnicalIndicators.calculate_vwap(df)
 
         # ATR
-        df['ATR'] = TechnicalIndicators.calculate_atr(df, config.get('atr_period', 14))
+        df['ATR'] = TechnicalIndicators.calculate_atr(df, config.atr_period)
 
         # RSI
-        df['RSI'] = TechnicalIndicators.calculate_rsi(df, config.get('rsi_period', 14))
+        df['RSI'] = TechnicalIndicators.calculate_rsi(df, config.rsi_period)
 
         # Volume surge
         df['Volume_Avg_10'] = df['Volume'].rolling(window=10).mean()
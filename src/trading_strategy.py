@@ -5,11 +5,11 @@ Implements 20 EMA + 200 EMA + VWAP trend-following strategy
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 from .data_fetcher import DataFetcher
 from .technical_indicators import TechnicalIndicators
-from config.config import TRADING_CONFIG
+from config.config import TradingConfig
 
 
 class TradingStrategy:
@@ -20,8 +20,8 @@ class TradingStrategy:
     - SELL: Price < 200 EMA, < VWAP, pullback to 20 EMA, bearish reversal
     """
 
-    def __init__(self, config: dict = None):
-        self.config = config or TRADING_CONFIG
+    def __init__(self, config: Optional[Union[TradingConfig, Dict]] = None):
+        self.config = TradingConfig.from_config(config)
         self.data_fetcher = DataFetcher()
         self.tech_indicators = TechnicalIndicators()
 
@@ -275,7 +275,7 @@ class TradingStrategy:
             Tuple of (quantity, risk_amount)
         """
         if risk_pct is None:
-            risk_pct = self.config['risk_per_trade_pct']
+            risk_pct = self.config.risk_per_trade_pct
 
         risk_amount = capital * (risk_pct / 100)
         risk_per_share = abs(entry_price - stop_loss)
@@ -310,7 +310,7 @@ class TradingStrategy:
 
         if method == 'atr':
             # ATR-based stop-loss
-            multiplier = self.config['stop_loss_atr_multiplier']
+            multiplier = self.config.stop_loss_atr_multiplier
 
             if setup_type == 'BUY':
                 stop_loss = current_price - (atr * multiplier)